@@ -12,7 +12,7 @@ for running migrations with Alembic.
 import os
 from logging.config import fileConfig
 
-from sqlalchemy import engine_from_config, pool
+from sqlalchemy import engine_from_config
 from alembic import context
 
 from dotenv import load_dotenv
@@ -28,14 +28,7 @@ config.set_main_option("sqlalchemy.url", DATABASE_URL)
 
 # Import your app's MetaData for 'autogenerate' support.
 # Unified for all models.
-from app.models import (  # Import all model modules to ensure full registry.
-    user, role, admin, student, professor, associate_teacher, department,
-    specialization, course_catalog, academic_session, course_offering,
-    section_group, enrollment, student_section_assignment, scheduled_slot,
-    assignment, assignment_file, assignment_submission, quiz, quiz_file,
-    question, question_option, quiz_attempt, quiz_answer,
-    quiz_file_submission, grade, room, uploaded_file, notification
-)
+import app.models.__all_models__  # noqa: F401 - registers and configures every mapper
 from app.models.base import Base  # A Base = declarative_base() subclass common to all models
 
 target_metadata = Base.metadata
@@ -55,10 +48,10 @@ def run_migrations_offline():
 
 def run_migrations_online():
     """Run migrations in 'online' mode with DB connectivity."""
+    # Default QueuePool: any connection checked out besides the migration one is reused
     connectable = engine_from_config(
         config.get_section(config.config_ini_section),
         prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
     )
 
     with connectable.connect() as connection:
@@ -0,0 +1,45 @@
+"""Add composite index for assignment submission lookups
+
+Revision ID: 3f2a9c4d7b1e
+Revises: 8159ef0793f9
+Create Date: 2026-10-16 09:00:00.000000
+
+This migration file is auto-generated by Alembic for University LMS Backend production schema changes.
+
+- No sample/demo changes.
+- Unified for real production migrations only.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+
+# revision identifiers, used by Alembic.
+revision = '3f2a9c4d7b1e'
+down_revision = '8159ef0793f9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply schema changes."""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_assignment_submissions_assignment_id_student_id',
+            'assignment_submissions',
+            ['assignment_id', 'student_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Revert schema changes."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_assignment_submissions_assignment_id_student_id',
+            table_name='assignment_submissions',
+            postgresql_concurrently=True,
+        )
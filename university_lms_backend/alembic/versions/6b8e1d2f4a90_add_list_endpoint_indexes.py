@@ -0,0 +1,54 @@
+"""Add composite indexes for enrollment, grade, and notification lists
+
+Revision ID: 6b8e1d2f4a90
+Revises: 3f2a9c4d7b1e
+Create Date: 2026-10-16 12:00:00.000000
+
+This migration file is auto-generated by Alembic for University LMS Backend production schema changes.
+
+- No sample/demo changes.
+- Unified for real production migrations only.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+
+# revision identifiers, used by Alembic.
+revision = '6b8e1d2f4a90'
+down_revision = '3f2a9c4d7b1e'
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns)
+INDEXES = [
+    ('ix_enrollments_section_group_id_created_at', 'enrollments', ['section_group_id', 'created_at']),
+    ('ix_grades_student_id_created_at', 'grades', ['student_id', 'created_at']),
+    ('ix_notifications_user_id_created_at', 'notifications', ['user_id', 'created_at']),
+]
+
+
+def upgrade() -> None:
+    """Apply schema changes."""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    """Revert schema changes."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+            )
@@ -0,0 +1,53 @@
+"""Add composite indexes for quiz attempt and section assignment lists
+
+Revision ID: 9d3f5b7a1c2e
+Revises: 6b8e1d2f4a90
+Create Date: 2026-10-16 18:00:00.000000
+
+This migration file is auto-generated by Alembic for University LMS Backend production schema changes.
+
+- No sample/demo changes.
+- Unified for real production migrations only.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+
+# revision identifiers, used by Alembic.
+revision = '9d3f5b7a1c2e'
+down_revision = '6b8e1d2f4a90'
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns)
+INDEXES = [
+    ('ix_quiz_attempts_quiz_id_student_id', 'quiz_attempts', ['quiz_id', 'student_id']),
+    ('ix_student_section_assignments_section_group_id_student_id', 'student_section_assignments', ['section_group_id', 'student_id']),
+]
+
+
+def upgrade() -> None:
+    """Apply schema changes."""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    """Revert schema changes."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+            )
@@ -0,0 +1,44 @@
+"""Widen the section group student index to the (student_id, assignment_id) keyset
+
+Revision ID: c4e7a2b9d815
+Revises: 9d3f5b7a1c2e
+Create Date: 2026-10-16 20:00:00.000000
+
+This migration file is auto-generated by Alembic for University LMS Backend production schema changes.
+
+- No sample/demo changes.
+- Unified for real production migrations only.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4e7a2b9d815'
+down_revision = '9d3f5b7a1c2e'
+branch_labels = None
+depends_on = None
+
+TABLE = 'student_section_assignments'
+OLD_INDEX = ('ix_student_section_assignments_section_group_id_student_id', ['section_group_id', 'student_id'])
+NEW_INDEX = ('ix_student_section_assignments_group_student_assignment', ['section_group_id', 'student_id', 'assignment_id'])
+
+
+def _swap(create, drop) -> None:
+    # CONCURRENTLY cannot run inside a transaction block; build the replacement before dropping
+    with op.get_context().autocommit_block():
+        name, columns = create
+        op.create_index(name, TABLE, columns, unique=False, postgresql_concurrently=True)
+        op.drop_index(drop[0], table_name=TABLE, postgresql_concurrently=True)
+
+
+def upgrade() -> None:
+    """Apply schema changes."""
+    _swap(NEW_INDEX, OLD_INDEX)
+
+
+def downgrade() -> None:
+    """Revert schema changes."""
+    _swap(OLD_INDEX, NEW_INDEX)
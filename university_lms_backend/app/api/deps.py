@@ -9,25 +9,21 @@ Use these wherever shared objects or reusable business logic is required.
 - No sample/demo/legacy logic.
 """
 
-from fastapi import Depends, HTTPException, status, Request
 from sqlalchemy.orm import Session
-from app.core.database import get_db
-from app.core.auth import get_current_user as global_get_current_user
+from typing import Generator
+from app.core.database import SessionLocal
+from app.core.auth import get_current_user
 
-def get_db_session() -> Session:
+# get_current_user is re-exported unchanged for Depends(...)
+__all__ = ["get_current_user", "get_db_session"]
+
+def get_db_session() -> Generator[Session, None, None]:
     """
     Provides a DB session used throughout the application (production safe).
     Use as a dependency: Depends(get_db_session)
     """
-    db = next(get_db())
+    db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
-
-async def get_current_user(request: Request = None):
-    """
-    Production-safe dependency for retrieving the current authenticated user.
-    May be used with custom injected logic or to override the user in testing.
-    """
-    return await global_get_current_user(request)
\ No newline at end of file
@@ -10,10 +10,12 @@ within the University LMS backend.
 """
 
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status
+from sqlalchemy.orm import Session
 from typing import List
 from app.schemas.assignment_file import AssignmentFileCreate, AssignmentFileResponse
 from app.services.assignment_file_service import AssignmentFileService
 from app.core.auth import get_current_user
+from app.core.database import get_db
 from app.core.security import validate_upload_file
 
 router = APIRouter()
@@ -25,18 +27,20 @@ router = APIRouter()
     status_code=status.HTTP_201_CREATED,
 )
 async def upload_assignment_file(
-    assignment_id: str,
+    assignment_id: int,
     file: UploadFile = File(...),
+    db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """
     Upload a file related to an assignment.
     - Only professors or associate teachers for the course/section can upload.
     - Validates file type and size using unified components.
+    - The file is streamed to storage in chunks, never buffered whole in memory.
     """
     validate_upload_file(file)
     return await AssignmentFileService.create_assignment_file(
-        assignment_id=assignment_id, file=file, user=current_user
+        db=db, assignment_id=assignment_id, file=file, user=current_user
     )
 
 @router.get(
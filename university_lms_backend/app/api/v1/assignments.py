@@ -11,14 +11,17 @@ Handles all endpoints related to assignment management for university courses.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
 from typing import List
 from app.schemas.assignment import (
     AssignmentCreate,
     AssignmentUpdate,
     AssignmentResponse,
+    AssignmentWithMySubmissionResponse,
 )
 from app.services.assignment_service import AssignmentService
 from app.core.auth import get_current_user
+from app.core.database import get_db
 
 router = APIRouter()
 
@@ -111,4 +114,27 @@ async def list_assignments_for_section_group(
     """
     return await AssignmentService.list_assignments_by_section_group(
         section_group_id=section_group_id, user=current_user
-    )
\ No newline at end of file
+    )
+
+@router.get(
+    "/section-group/{section_group_id}/with-my-submission",
+    response_model=List[AssignmentWithMySubmissionResponse],
+    summary="List assignments for a section group with the current student's submissions"
+)
+def list_assignments_with_my_submission(
+    section_group_id: int,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """
+    List all assignments of a section group, each paired with the current user's
+    final submission (or null), in one request and one query.
+    Replaces listing assignments and then fetching /mine/{assignment_id} per assignment.
+    """
+    rows = AssignmentService.list_with_submissions_for_student(
+        db=db, section_group_id=section_group_id, student_id=current_user.user_id
+    )
+    return [
+        {"assignment": assignment, "my_submission": submission}
+        for assignment, submission in rows
+    ]
@@ -9,7 +9,9 @@ for the University LMS.
 - Unified with domain schemas and service logic.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
 from typing import List
 from app.schemas.course import (
     CourseCatalogResponse,
@@ -19,6 +21,14 @@ from app.schemas.course import (
 )
 from app.services.course_service import CourseService
 from app.core.auth import get_current_user
+from app.core.cache import cached_json_response, clear_namespace
+from app.core.database import get_db
+from app.core.responses import not_modified, set_collection_headers
+
+# Catalog listings are shared by every user of the same role
+CATALOG_CACHE_NAMESPACE = "catalog"
+CATALOG_CACHE_FRESH_SECONDS = 300
+CATALOG_CACHE_STALE_SECONDS = 3600  # served while a background refresh runs
 
 router = APIRouter()
 
@@ -28,14 +38,28 @@ router = APIRouter()
     summary="List all catalog courses"
 )
 async def list_catalog_courses(
+    request: Request,
     search: str = "",
     current_user=Depends(get_current_user),
 ):
     """
     List all courses available in the course catalog.
     Filtering and searching supported.
+    Cached per (search, role), never per user, with stale-while-revalidate;
+    a client already holding the cached list is answered with 304.
     """
-    return await CourseService.list_catalog_courses(search=search, user=current_user)
+    response = await cached_json_response(
+        CATALOG_CACHE_NAMESPACE,
+        f"v1:{search}:{current_user.role_id}",
+        CATALOG_CACHE_FRESH_SECONDS,
+        CATALOG_CACHE_STALE_SECONDS,
+        lambda: run_in_threadpool(CourseService.load_catalog_courses, search),
+    )
+    etag = response.headers["ETag"]
+    if (unchanged := not_modified(request, etag)) is not None:
+        return unchanged
+    set_collection_headers(response, etag)
+    return response
 
 @router.get(
     "/catalog/{course_code}",
@@ -64,21 +88,28 @@ async def create_course(
     """
     Admins can create new courses in the system.
     """
-    return await CourseService.create_course(data=course, user=current_user)
+    created = await CourseService.create_course(data=course, user=current_user)
+    await clear_namespace(CATALOG_CACHE_NAMESPACE)
+    return created
 
 @router.get(
     "/{course_id}",
     response_model=CourseResponse,
     summary="Get course details by ID"
 )
-async def get_course(
-    course_id: str,
+def get_course(
+    course_id: int,
+    db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """
     Retrieve a course and its sections, staff, enrollment data etc.
+    Plain `def`: the batched loading queries are blocking and run in FastAPI's threadpool.
     """
-    return await CourseService.get_course_by_id(course_id=course_id, user=current_user)
+    course = CourseService.get_by_id(db, course_id)
+    if course is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Course not found.")
+    return CourseResponse.model_validate(course, from_attributes=True)
 
 @router.patch(
     "/{course_id}",
@@ -93,9 +124,11 @@ async def update_course(
     """
     Admins can update core course info.
     """
-    return await CourseService.update_course(
+    updated = await CourseService.update_course(
         course_id=course_id, data=course_update, user=current_user
     )
+    await clear_namespace(CATALOG_CACHE_NAMESPACE)
+    return updated
 
 @router.delete(
     "/{course_id}",
@@ -110,4 +143,5 @@ async def delete_course(
     Admins can (soft-)delete courses from the system.
     """
     await CourseService.delete_course(course_id=course_id, user=current_user)
+    await clear_namespace(CATALOG_CACHE_NAMESPACE)
     return None
\ No newline at end of file
@@ -8,7 +8,9 @@ Manages CRUD operations for academic departments in the University LMS.
 - Access control strictly enforced (admin for write, all users for read).
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
 from typing import List
 from app.schemas.department import (
     DepartmentCreate,
@@ -17,6 +19,13 @@ from app.schemas.department import (
 )
 from app.services.department_service import DepartmentService
 from app.core.auth import get_current_user
+from app.core.cache import cached_json_response, clear_namespace
+from app.core.database import get_db
+from app.core.responses import not_modified, set_collection_headers
+
+# Departments change rarely and are visible to every role
+DEPARTMENTS_CACHE_NAMESPACE = "departments"
+DEPARTMENTS_CACHE_EXPIRE_SECONDS = 3600
 
 router = APIRouter()
 
@@ -25,12 +34,28 @@ router = APIRouter()
     response_model=List[DepartmentResponse],
     summary="List all departments"
 )
-async def list_departments(current_user=Depends(get_current_user)):
+async def list_departments(
+    request: Request,
+    current_user=Depends(get_current_user),
+):
     """
     Retrieve all departments.
     All users (students, staff) may view departments.
+    Cached per role, never per user; a client already holding the cached list
+    is answered with 304.
     """
-    return await DepartmentService.list_departments(user=current_user)
+    response = await cached_json_response(
+        DEPARTMENTS_CACHE_NAMESPACE,
+        f"all:{current_user.role_id}",
+        DEPARTMENTS_CACHE_EXPIRE_SECONDS,
+        0,
+        lambda: run_in_threadpool(DepartmentService.list_departments),
+    )
+    etag = response.headers["ETag"]
+    if (unchanged := not_modified(request, etag)) is not None:
+        return unchanged
+    set_collection_headers(response, etag)
+    return response
 
 @router.get(
     "/{dept_code}",
@@ -39,12 +64,20 @@ async def list_departments(current_user=Depends(get_current_user)):
 )
 async def get_department(
     dept_code: str,
+    db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """
     Retrieve a department's information by its code.
+    Served from the per-process department cache; the database is only
+    queried if the cache has not been loaded yet.
     """
-    return await DepartmentService.get_department_by_code(dept_code=dept_code, user=current_user)
+    loaded, department = DepartmentService.get_cached_by_code(dept_code)
+    if not loaded:
+        department = await run_in_threadpool(DepartmentService.get_by_code, db, dept_code)
+    if department is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Department not found.")
+    return department
 
 @router.post(
     "/",
@@ -60,7 +93,9 @@ async def create_department(
     Create a new academic department.
     Only admins can create.
     """
-    return await DepartmentService.create_department(data=department, user=current_user)
+    created = await DepartmentService.create_department(data=department, user=current_user)
+    await clear_namespace(DEPARTMENTS_CACHE_NAMESPACE)
+    return created
 
 @router.patch(
     "/{dept_code}",
@@ -76,9 +111,11 @@ async def update_department(
     Update info for a department.
     Only admins can update.
     """
-    return await DepartmentService.update_department(
+    updated = await DepartmentService.update_department(
         dept_code=dept_code, data=department_update, user=current_user
     )
+    await clear_namespace(DEPARTMENTS_CACHE_NAMESPACE)
+    return updated
 
 @router.delete(
     "/{dept_code}",
@@ -94,4 +131,5 @@ async def delete_department(
     Admins only; consider soft delete policy.
     """
     await DepartmentService.delete_department(dept_code=dept_code, user=current_user)
+    await clear_namespace(DEPARTMENTS_CACHE_NAMESPACE)
     return None
\ No newline at end of file
@@ -10,7 +10,9 @@ Manages student enrollments in courses and section groups for University LMS.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
 from typing import List
+from pydantic import TypeAdapter
 from app.schemas.enrollment import (
     EnrollmentCreate,
     EnrollmentUpdate,
@@ -18,9 +20,14 @@ from app.schemas.enrollment import (
 )
 from app.services.enrollment_service import EnrollmentService
 from app.core.auth import get_current_user
+from app.core.database import get_db
+from app.core.responses import json_list_response
 
 router = APIRouter()
 
+# Compiled once; reused by every list response in this router
+_ENROLLMENT_LIST = TypeAdapter(List[EnrollmentResponse])
+
 @router.post(
     "/",
     response_model=EnrollmentResponse,
@@ -75,14 +82,15 @@ async def withdraw_enrollment(
     response_model=List[EnrollmentResponse],
     summary="List enrollments for a section group (staff only)"
 )
-async def list_enrollments_for_section_group(
-    section_group_id: str,
+def list_enrollments_for_section_group(
+    section_group_id: int,
+    db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """
     List all enrollments for a section group.
-    Only admin, professor, or associate teachers for the group.
+    Only admin, professor, or associate teachers for the group (enforced in the query).
+    Plain `def`: the query is blocking and runs in FastAPI's threadpool.
     """
-    return await EnrollmentService.list_enrollments_for_section_group(
-        section_group_id=section_group_id, user=current_user
-    )
\ No newline at end of file
+    enrollments = EnrollmentService.get_by_section_group_id(db, section_group_id, current_user)
+    return json_list_response(_ENROLLMENT_LIST, enrollments)
\ No newline at end of file
@@ -9,18 +9,27 @@ Handles uploading, downloading, and management of files within University LMS.
 - No samples, demos, or legacy logic.
 """
 
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Request, status
+from fastapi.responses import FileResponse
+from sqlalchemy.orm import Session
 from typing import List
+from pydantic import TypeAdapter
 from app.schemas.file import (
     FileUploadResponse,
     FileInfoResponse,
 )
 from app.services.file_service import FileService
 from app.core.auth import get_current_user
+from app.core.database import get_db
+from app.core.responses import json_list_response
 from app.core.security import validate_upload_file
+from app.core.storage import sign_download, verify_download
 
 router = APIRouter()
 
+# Compiled once; reused by every list response in this router
+_FILE_INFO_LIST = TypeAdapter(List[FileInfoResponse])
+
 @router.post(
     "/upload",
     response_model=FileUploadResponse,
@@ -29,29 +38,78 @@ router = APIRouter()
 )
 async def upload_file(
     file: UploadFile = File(...),
+    db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """
     Upload a file for assignments, quizzes, or materials.
     - Enforces unified type/size restrictions.
     - File is linked to the user and a usage context.
+    - Streamed to storage in chunks; never buffered in memory.
     """
     validate_upload_file(file)
-    return await FileService.upload_file(file=file, user=current_user)
+    return await FileService.upload_file(db=db, file=file, user_id=current_user.user_id)
 
 @router.get(
     "/{file_id}",
     response_model=FileInfoResponse,
     summary="Get file info and download link by file ID"
 )
-async def get_file(
-    file_id: str,
+def get_file(
+    file_id: int,
+    request: Request,
+    db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """
     Get file info and a secure download URL, if authorized.
+    The URL is signed and expires shortly; fetching it needs no further auth lookup.
+    """
+    file_obj = FileService.get_by_id(db, file_id)
+    if not file_obj:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found.")
+    if file_obj.user_id != current_user.user_id and not current_user.is_admin:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed to access this file.")
+
+    expires, signature = sign_download(file_obj.file_id)
+    download_url = request.url_for("download_file", file_id=file_obj.file_id).include_query_params(
+        expires=expires, signature=signature
+    )
+    return {
+        "file_id": file_obj.file_id,
+        "filename": file_obj.filename,
+        "file_path": file_obj.file_path,
+        "mime_type": file_obj.file_type,
+        "uploaded_by": file_obj.user_id,
+        "uploaded_at": file_obj.uploaded_at,
+        "download_url": str(download_url),
+    }
+
+@router.get(
+    "/{file_id}/download",
+    response_class=FileResponse,
+    summary="Download a file through a signed URL from GET /files/{file_id}"
+)
+def download_file(
+    file_id: int,
+    expires: int,
+    signature: str,
+    db: Session = Depends(get_db),
+):
+    """
+    Serve file bytes for a valid, unexpired signature.
+    Range requests are handled by FileResponse.
     """
-    return await FileService.get_file_by_id(file_id=file_id, user=current_user)
+    if not verify_download(file_id, expires, signature):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid or expired download link.")
+    file_obj = FileService.get_by_id(db, file_id)
+    if not file_obj:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found.")
+    return FileResponse(
+        file_obj.file_path,
+        media_type=file_obj.file_type or "application/octet-stream",
+        filename=file_obj.filename,
+    )
 
 @router.delete(
     "/{file_id}",
@@ -79,4 +137,5 @@ async def list_user_files(
     """
     List all files uploaded by the current user.
     """
-    return await FileService.list_files_by_user(user=current_user)
\ No newline at end of file
+    files = await FileService.list_files_by_user(user=current_user)
+    return json_list_response(_FILE_INFO_LIST, files)
\ No newline at end of file
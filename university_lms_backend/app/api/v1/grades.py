@@ -10,8 +10,10 @@ Key Features:
 - No demo/sample code, only real production logic and validation.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Body, Depends, HTTPException, status
+from sqlalchemy.orm import Session
 from typing import List
+from pydantic import TypeAdapter
 from app.schemas.grade import (
     GradeCreate,
     GradeUpdate,
@@ -19,9 +21,16 @@ from app.schemas.grade import (
 )
 from app.services.grade_service import GradeService
 from app.core.auth import get_current_user
+from app.core.database import get_db
+from app.core.responses import json_list_response
 
 router = APIRouter()
 
+MAX_BULK_GRADES = 1000
+
+# Compiled once; reused by every list response in this router
+_GRADE_LIST = TypeAdapter(List[GradeResponse])
+
 @router.post(
     "/",
     response_model=GradeResponse,
@@ -38,6 +47,31 @@ async def enter_grade(
     """
     return await GradeService.enter_grade(grade=grade, user=current_user)
 
+@router.post(
+    "/bulk",
+    response_model=List[GradeResponse],
+    status_code=status.HTTP_201_CREATED,
+    summary="Enter many grades at once (staff only)"
+)
+def enter_grades_bulk(
+    grades: List[GradeCreate] = Body(..., min_length=1, max_length=MAX_BULK_GRADES),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """
+    Enter up to MAX_BULK_GRADES grades in one request (e.g. a whole midterm).
+    Access is checked once for every course offering in the batch,
+    and all rows are inserted in a single round-trip.
+    """
+    offering_ids = {g.course_offering_id for g in grades}
+    if not GradeService.can_grade_offerings(db, current_user, offering_ids):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not allowed to grade one or more of these course offerings.",
+        )
+    created = GradeService.bulk_create(db, grades)
+    return json_list_response(_GRADE_LIST, created, status_code=status.HTTP_201_CREATED)
+
 @router.get(
     "/{grade_id}",
     response_model=GradeResponse,
@@ -58,16 +92,19 @@ async def get_grade(
     response_model=List[GradeResponse],
     summary="List all grades for a student (student or staff only)"
 )
-async def list_grades_for_student(
-    student_id: str,
+def list_grades_for_student(
+    student_id: int,
+    db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """
     List all grades for a specific student.
     Staff: only if assigned to student's section(s).
     Student: only self.
+    Access is enforced in the query, so only visible grades are fetched.
     """
-    return await GradeService.list_grades_for_student(student_id=student_id, user=current_user)
+    grades = GradeService.get_visible_for_student(db, student_id, current_user)
+    return json_list_response(_GRADE_LIST, grades)
 
 @router.get(
     "/enrollment/{enrollment_id}",
@@ -81,7 +118,8 @@ async def list_grades_for_enrollment(
     """
     List all grades for a student in the context of an enrollment (section/course).
     """
-    return await GradeService.list_grades_for_enrollment(enrollment_id=enrollment_id, user=current_user)
+    grades = await GradeService.list_grades_for_enrollment(enrollment_id=enrollment_id, user=current_user)
+    return json_list_response(_GRADE_LIST, grades)
 
 @router.patch(
     "/{grade_id}",
@@ -9,17 +9,26 @@ Handles user notifications delivery, read-status, and management in University L
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
 from typing import List
+from pydantic import TypeAdapter
 from app.schemas.notification import (
+    NotificationBroadcast,
+    NotificationBroadcastResponse,
     NotificationCreate,
     NotificationResponse,
     NotificationUpdate,
 )
 from app.services.notification_service import NotificationService
-from app.core.auth import get_current_user
+from app.core.auth import get_current_user, require_admin
+from app.core.database import get_db
+from app.core.responses import json_list_response
 
 router = APIRouter()
 
+# Compiled once; reused by every list response in this router
+_NOTIFICATION_LIST = TypeAdapter(List[NotificationResponse])
+
 @router.get(
     "/",
     response_model=List[NotificationResponse],
@@ -29,7 +38,8 @@ async def list_notifications(current_user=Depends(get_current_user)):
     """
     User can fetch all of their notifications, newest first.
     """
-    return await NotificationService.list_notifications(user=current_user)
+    notifications = await NotificationService.list_notifications(user=current_user)
+    return json_list_response(_NOTIFICATION_LIST, notifications)
 
 @router.post(
     "/",
@@ -46,6 +56,29 @@ async def send_notification(
     """
     return await NotificationService.send_notification(notification=notification, user=current_user)
 
+@router.post(
+    "/broadcast",
+    response_model=NotificationBroadcastResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Broadcast a notification to all users or one role (admin only)",
+    dependencies=[Depends(require_admin)],
+)
+def broadcast_notification(
+    broadcast: NotificationBroadcast,
+    db: Session = Depends(get_db),
+):
+    """
+    Admin can notify every active user, or every user with a given role,
+    in a single bulk insert.
+    """
+    sent = NotificationService.broadcast(
+        db,
+        message=broadcast.message,
+        notification_type=broadcast.type,
+        role_id=broadcast.role_id,
+    )
+    return {"sent": sent}
+
 @router.patch(
     "/{notification_id}",
     response_model=NotificationResponse,
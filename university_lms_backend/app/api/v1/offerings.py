@@ -9,8 +9,10 @@ and section-group creation/listing for University LMS.
 - No samples, demos, or dev logic—real production code only.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy.orm import Session
 from typing import List
+from pydantic import TypeAdapter
 from app.schemas.offering import (
     CourseOfferingCreate,
     CourseOfferingUpdate,
@@ -18,8 +20,21 @@ from app.schemas.offering import (
 )
 from app.services.offering_service import CourseOfferingService
 from app.core.auth import get_current_user
+from app.core.database import get_db
+from app.core.responses import (
+    collection_etag,
+    json_list_response,
+    not_modified,
+    set_collection_headers,
+)
+from app.models.course_offering import CourseOffering
+
+# Every offerings route requires an authenticated user; FastAPI resolves the
+# dependency once per request and shares it with routes that also declare it.
+router = APIRouter(dependencies=[Depends(get_current_user)])
 
-router = APIRouter()
+# Compiled once; reused by every list response in this router
+_OFFERING_LIST = TypeAdapter(List[CourseOfferingResponse])
 
 @router.post(
     "/",
@@ -92,13 +107,25 @@ async def delete_offering(
     response_model=List[CourseOfferingResponse],
     summary="List all course offerings for an academic session"
 )
-async def list_offerings_in_session(
-    session_id: str,
-    current_user=Depends(get_current_user),
+def list_offerings_in_session(
+    session_id: int,
+    request: Request,
+    db: Session = Depends(get_db),
 ):
     """
     List all offerings in a given academic session (for registration, search/admin).
+    Any authenticated user may list; the router-level dependency enforces that.
+    Plain `def`: the query is blocking and runs in FastAPI's threadpool.
+    Unchanged lists are answered with 304 before any rows are loaded.
     """
-    return await CourseOfferingService.list_offerings_by_session(
-        session_id=session_id, user=current_user
-    )
\ No newline at end of file
+    etag = collection_etag(
+        db,
+        CourseOffering.updated_at,
+        CourseOffering.academic_session_id == session_id,
+    )
+    if (unchanged := not_modified(request, etag)) is not None:
+        return unchanged
+    offerings = CourseOfferingService.get_by_session_id(db, session_id)
+    response = json_list_response(_OFFERING_LIST, offerings)
+    set_collection_headers(response, etag)
+    return response
\ No newline at end of file
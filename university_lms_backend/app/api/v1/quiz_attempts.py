@@ -9,7 +9,10 @@ Handles quiz attempt session management and staff/student access.
 - No sample/demo, only production logic.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session
 from typing import List
 from app.schemas.quiz_attempt import (
     QuizAttemptCreate,
@@ -18,8 +21,17 @@ from app.schemas.quiz_attempt import (
 )
 from app.services.quiz_attempt_service import QuizAttemptService
 from app.core.auth import get_current_user
+from app.core.database import get_db
+from app.core.responses import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    json_list_response,
+    set_next_cursor,
+)
+
+router = APIRouter(dependencies=[Depends(get_current_user)])
 
-router = APIRouter()
+_ATTEMPT_LIST = TypeAdapter(List[QuizAttemptResponse])
 
 @router.post(
     "/",
@@ -57,29 +69,42 @@ async def get_my_quiz_attempts(
     response_model=List[QuizAttemptResponse],
     summary="List all quiz attempts (staff only for review/grading)"
 )
-async def list_attempts_for_quiz(
-    quiz_id: str,
+def list_attempts_for_quiz(
+    quiz_id: int,
+    after: int = Query(0, ge=0, description="Cursor from the previous page's X-Next-Cursor header"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """
-    Professors and associate teachers retrieve all attempts for this quiz for staff review.
+    Professors and associate teachers page through the attempts on this quiz for staff review.
+    Access is enforced in the query.
     """
-    return await QuizAttemptService.list_attempts_for_quiz(quiz_id=quiz_id, user=current_user)
+    rows = QuizAttemptService.get_visible_for_quiz(db, quiz_id, current_user, after=after, limit=limit)
+    response = json_list_response(_ATTEMPT_LIST, rows)
+    set_next_cursor(response, rows, limit, "attempt_id")
+    return response
 
 @router.get(
     "/{attempt_id}",
     response_model=QuizAttemptResponse,
     summary="Get a quiz attempt by ID (own or staff only)"
 )
-async def get_quiz_attempt(
-    attempt_id: str,
+def get_quiz_attempt(
+    attempt_id: int,
+    db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """
     Retrieve details about a specific quiz attempt.
     Role: Student (own attempt) or assigned staff.
     """
-    return await QuizAttemptService.get_attempt_by_id(attempt_id=attempt_id, user=current_user)
+    if not QuizAttemptService.can_view(db, current_user, attempt_id):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not permitted to view this attempt.")
+    attempt = QuizAttemptService.get_by_id(db, attempt_id)
+    if attempt is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Quiz attempt not found.")
+    return attempt
 
 @router.patch(
     "/{attempt_id}",
@@ -87,13 +112,20 @@ async def get_quiz_attempt(
     summary="Update a quiz attempt (submit, mark finished, etc)"
 )
 async def update_quiz_attempt(
-    attempt_id: str,
+    attempt_id: int,
     attempt_update: QuizAttemptUpdate,
+    db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """
     Update attempt status (submit, mark complete, grant extension, etc).
+    Setting status to "completed" submits the caller's own attempt and auto-grades it.
     """
+    if attempt_update.status == "completed":
+        attempt = await run_in_threadpool(QuizAttemptService.submit, db, attempt_id, current_user.user_id)
+        if attempt is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No open attempt with this ID.")
+        return attempt
     return await QuizAttemptService.update_attempt(
         attempt_id=attempt_id, attempt_update=attempt_update, user=current_user
     )
@@ -9,13 +9,17 @@ Handles the upload, retrieval, and management of files attached to quizzes for t
 """
 
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
 from typing import List
 from app.schemas.quiz_file import QuizFileCreate, QuizFileResponse
 from app.services.quiz_file_service import QuizFileService
+from app.services.quiz_service import QuizService
 from app.core.auth import get_current_user
+from app.core.database import get_db
 from app.core.security import validate_upload_file
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(get_current_user)])
 
 @router.post(
     "/",
@@ -24,8 +28,9 @@ router = APIRouter()
     status_code=status.HTTP_201_CREATED,
 )
 async def upload_quiz_file(
-    quiz_id: str,
+    quiz_id: int,
     file: UploadFile = File(...),
+    db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """
@@ -33,11 +38,9 @@ async def upload_quiz_file(
     Only staff for the course/section can upload. Validates type/size using global validator.
     """
     validate_upload_file(file)
-    return await QuizFileService.create_quiz_file(
-        quiz_id=quiz_id,
-        file=file,
-        user=current_user
-    )
+    if not await run_in_threadpool(QuizService.can_manage, db, current_user, quiz_id):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not permitted to upload files for this quiz.")
+    return await QuizFileService.upload(db, quiz_id, file, current_user.user_id)
 
 @router.get(
     "/{file_id}",
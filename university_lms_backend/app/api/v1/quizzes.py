@@ -10,6 +10,7 @@ Manages quizzes: creation, retrieval, update, publish, and deletion.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
 from typing import List
 from app.schemas.quiz import (
     QuizCreate,
@@ -18,8 +19,10 @@ from app.schemas.quiz import (
 )
 from app.services.quiz_service import QuizService
 from app.core.auth import get_current_user
+from app.core.database import get_db
+from app.core.permissions import RBACCache, get_rbac_cache
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(get_current_user)])
 
 @router.post(
     "/",
@@ -57,30 +60,46 @@ async def get_quiz(
     response_model=QuizResponse,
     summary="Update a quiz (staff only, before publishing or as allowed)"
 )
-async def update_quiz(
-    quiz_id: str,
+def update_quiz(
+    quiz_id: int,
     quiz_update: QuizUpdate,
+    db: Session = Depends(get_db),
+    rbac_cache: RBACCache = Depends(get_rbac_cache),
     current_user=Depends(get_current_user),
 ):
     """
     Update quiz properties (title, questions, publish/unpublish, deadlines, etc).
     Only allowed for the staff who created/are assigned to the quiz.
     """
-    return await QuizService.update_quiz(quiz_id=quiz_id, quiz_update=quiz_update, user=current_user)
+    if not QuizService.can_manage(db, current_user, quiz_id):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not permitted to modify this quiz.")
+    quiz = QuizService.update(db, quiz_id, quiz_update)
+    if quiz is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Quiz not found.")
+    if "course_offering_id" in quiz_update.model_fields_set:
+        # Moving the quiz to another offering changes who may manage it
+        rbac_cache.invalidate("quiz:", quiz_id)
+    return quiz
 
 @router.delete(
     "/{quiz_id}",
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete a quiz (staff only)"
 )
-async def delete_quiz(
-    quiz_id: str,
+def delete_quiz(
+    quiz_id: int,
+    db: Session = Depends(get_db),
+    rbac_cache: RBACCache = Depends(get_rbac_cache),
     current_user=Depends(get_current_user),
 ):
     """
     Delete a quiz (staff only).
     """
-    await QuizService.delete_quiz(quiz_id=quiz_id, user=current_user)
+    if not QuizService.can_manage(db, current_user, quiz_id):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not permitted to delete this quiz.")
+    if not QuizService.delete(db, quiz_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Quiz not found.")
+    rbac_cache.invalidate("quiz:", quiz_id)
     return None
 
 @router.get(
@@ -6,10 +6,13 @@ Manages user roles and their assignments within the University LMS.
 - Only uses unified schemas/services and validated access policies.
 - Admins can create, update, delete, and assign roles.
 - All users can list their own roles; only admins manage roles for others.
+- Admin routes are gated by the shared `require_admin` dependency, not re-checked in handlers.
 - Pure production code (no sample/demo logic).
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
 from typing import List
 from app.schemas.role import (
     RoleCreate,
@@ -20,47 +23,60 @@ from app.schemas.role import (
     UserRoleResponse,
 )
 from app.services.role_service import RoleService
-from app.core.auth import get_current_user
+from app.core.auth import get_current_user, require_admin
+from app.core.auth_cache import invalidate_user
+from app.core.database import get_db
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(get_current_user)])
 
 @router.get(
     "/",
     response_model=List[RoleResponse],
-    summary="List all roles (admin only)"
+    summary="List all roles (admin only)",
+    dependencies=[Depends(require_admin)],
 )
-async def list_roles(current_user=Depends(get_current_user)):
+def list_roles(
+    db: Session = Depends(get_db),
+):
     """
     List all defined roles in the system.
     Only accessible by admin users.
     """
-    return await RoleService.list_roles(user=current_user)
+    return RoleService.get_all(db)
 
 @router.get(
     "/me",
     response_model=List[UserRoleResponse],
     summary="List all roles assigned to the current user"
 )
-async def list_my_roles(current_user=Depends(get_current_user)):
+def list_my_roles(
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
     """
     List all roles for the currently authenticated user.
     """
-    return await RoleService.list_user_roles(user_id=current_user.id, user=current_user)
+    assignment = RoleService.get_user_role(db, current_user.user_id)
+    return [assignment] if assignment and assignment["role_id"] is not None else []
 
 @router.get(
     "/user/{user_id}",
     response_model=List[UserRoleResponse],
-    summary="List all roles assigned to a specific user (admin only)"
+    summary="List all roles assigned to a specific user (admin only)",
+    dependencies=[Depends(require_admin)],
 )
-async def list_user_roles(
-    user_id: str,
-    current_user=Depends(get_current_user),
+def list_user_roles(
+    user_id: int,
+    db: Session = Depends(get_db),
 ):
     """
     List all roles for the specified user.
     Only accessible by admins.
     """
-    return await RoleService.list_user_roles(user_id=user_id, user=current_user)
+    assignment = RoleService.get_user_role(db, user_id)
+    if assignment is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found.")
+    return [assignment] if assignment["role_id"] is not None else []
 
 @router.post(
     "/",
@@ -70,7 +86,7 @@ async def list_user_roles(
 )
 async def create_role(
     role: RoleCreate,
-    current_user=Depends(get_current_user),
+    current_user=Depends(require_admin),
 ):
     """
     Create a new global/system-wide role.
@@ -86,7 +102,7 @@ async def create_role(
 async def update_role(
     role_id: str,
     role_update: RoleUpdate,
-    current_user=Depends(get_current_user),
+    current_user=Depends(require_admin),
 ):
     """
     Update a role's permissions or metadata.
@@ -101,7 +117,7 @@ async def update_role(
 )
 async def delete_role(
     role_id: str,
-    current_user=Depends(get_current_user),
+    current_user=Depends(require_admin),
 ):
     """
     Delete a role by ID.
@@ -113,17 +129,22 @@ async def delete_role(
 @router.post(
     "/assign",
     response_model=UserRoleResponse,
-    summary="Assign a role to a user (admin only)"
+    summary="Assign a role to a user (admin only)",
+    dependencies=[Depends(require_admin)],
 )
 async def assign_role(
     assignment: UserRoleAssignRequest,
-    current_user=Depends(get_current_user),
+    db: Session = Depends(get_db),
 ):
     """
     Assign a role to a user.
     Only accessible by admins.
     """
-    return await RoleService.assign_role(assignment=assignment, user=current_user)
+    result = await run_in_threadpool(RoleService.assign_role, db, assignment.user_id, assignment.role_id)
+    if result is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User or role not found.")
+    await invalidate_user(assignment.user_id)
+    return result
 
 @router.post(
     "/revoke",
@@ -132,7 +153,7 @@ async def assign_role(
 )
 async def revoke_role(
     revoke_request: UserRoleRevokeRequest,
-    current_user=Depends(get_current_user),
+    current_user=Depends(require_admin),
 ):
     """
     Revoke a role from a user.
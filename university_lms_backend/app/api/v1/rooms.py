@@ -6,9 +6,11 @@ Manages classroom/meeting room records within the University LMS.
 - Full production logic, no samples or demo code.
 - Only uses global schemas/services and production-grade validation.
 - Admin can create/update/delete rooms; all users can view.
+- Writes go through RoomService, which drops the cached room list.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
 from typing import List
 from app.schemas.room import (
     RoomCreate,
@@ -16,78 +18,89 @@ from app.schemas.room import (
     RoomResponse,
 )
 from app.services.room_service import RoomService
-from app.core.auth import get_current_user
+from app.core.auth import get_current_user, require_admin
+from app.core.database import get_db
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(get_current_user)])
 
 @router.get(
     "/",
     response_model=List[RoomResponse],
     summary="List all rooms"
 )
-async def list_rooms(
-    current_user=Depends(get_current_user)
+def list_rooms(
+    db: Session = Depends(get_db),
 ):
     """
     List all rooms available in the system.
     """
-    return await RoomService.list_rooms(user=current_user)
+    return RoomService.list_cached(db)
 
 @router.get(
     "/{room_id}",
     response_model=RoomResponse,
     summary="Get a room by ID"
 )
-async def get_room(
-    room_id: str,
-    current_user=Depends(get_current_user),
+def get_room(
+    room_id: int,
+    db: Session = Depends(get_db),
 ):
     """
     Retrieve a specific room by room ID.
     """
-    return await RoomService.get_room_by_id(room_id=room_id, user=current_user)
+    room = RoomService.get_by_id(db, room_id)
+    if room is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Room not found.")
+    return room
 
 @router.post(
     "/",
     response_model=RoomResponse,
     status_code=status.HTTP_201_CREATED,
-    summary="Create a new room (admin only)"
+    summary="Create a new room (admin only)",
+    dependencies=[Depends(require_admin)],
 )
-async def create_room(
+def create_room(
     room: RoomCreate,
-    current_user=Depends(get_current_user),
+    db: Session = Depends(get_db),
 ):
     """
     Admin creates a new room.
     """
-    return await RoomService.create_room(room=room, user=current_user)
+    return RoomService.create(db, room)
 
 @router.patch(
     "/{room_id}",
     response_model=RoomResponse,
-    summary="Update a room (admin only)"
+    summary="Update a room (admin only)",
+    dependencies=[Depends(require_admin)],
 )
-async def update_room(
-    room_id: str,
+def update_room(
+    room_id: int,
     room_update: RoomUpdate,
-    current_user=Depends(get_current_user),
+    db: Session = Depends(get_db),
 ):
     """
     Admin updates room details.
     """
-    return await RoomService.update_room(room_id=room_id, room_update=room_update, user=current_user)
+    room = RoomService.update(db, room_id, room_update)
+    if room is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Room not found.")
+    return room
 
 @router.delete(
     "/{room_id}",
     status_code=status.HTTP_204_NO_CONTENT,
-    summary="Delete a room (admin only)"
+    summary="Delete a room (admin only)",
+    dependencies=[Depends(require_admin)],
 )
-async def delete_room(
-    room_id: str,
-    current_user=Depends(get_current_user),
+def delete_room(
+    room_id: int,
+    db: Session = Depends(get_db),
 ):
     """
     Admin deletes a room by ID.
     """
-    await RoomService.delete_room(room_id=room_id, user=current_user)
-    return None
\ No newline at end of file
+    if not RoomService.delete(db, room_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Room not found.")
+    return None
@@ -19,7 +19,7 @@ from app.schemas.section_group import (
 from app.services.section_group_service import SectionGroupService
 from app.core.auth import get_current_user
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(get_current_user)])
 
 @router.post(
     "/",
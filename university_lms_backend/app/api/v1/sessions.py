@@ -9,6 +9,7 @@ Manages academic session records in the University LMS (e.g., Fall 2025, Spring
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
 from typing import List
 from app.schemas.session import (
     AcademicSessionCreate,
@@ -16,80 +17,89 @@ from app.schemas.session import (
     AcademicSessionResponse,
 )
 from app.services.session_service import AcademicSessionService
-from app.core.auth import get_current_user
+from app.core.auth import get_current_user, require_admin
+from app.core.database import get_db
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(get_current_user)])
 
 @router.post(
     "/",
     response_model=AcademicSessionResponse,
     status_code=status.HTTP_201_CREATED,
-    summary="Create an academic session (admin only)"
+    summary="Create an academic session (admin only)",
+    dependencies=[Depends(require_admin)],
 )
-async def create_session(
+def create_session(
     session: AcademicSessionCreate,
-    current_user=Depends(get_current_user),
+    db: Session = Depends(get_db),
 ):
     """
     Create a new academic session. Admin only.
     """
-    return await AcademicSessionService.create_session(session=session, user=current_user)
+    return AcademicSessionService.create(db, session)
 
 @router.get(
     "/",
     response_model=List[AcademicSessionResponse],
     summary="List all academic sessions"
 )
-async def list_sessions(
-    current_user=Depends(get_current_user),
+def list_sessions(
+    db: Session = Depends(get_db),
 ):
     """
     List all defined academic sessions.
     """
-    return await AcademicSessionService.list_sessions(user=current_user)
+    return AcademicSessionService.list_cached(db)
 
 @router.get(
     "/{session_id}",
     response_model=AcademicSessionResponse,
     summary="Get an academic session by ID"
 )
-async def get_session(
-    session_id: str,
-    current_user=Depends(get_current_user),
+def get_session(
+    session_id: int,
+    db: Session = Depends(get_db),
 ):
     """
     Retrieve a session by its database ID.
     """
-    return await AcademicSessionService.get_session_by_id(session_id=session_id, user=current_user)
+    session = AcademicSessionService.get_by_id(db, session_id)
+    if session is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Academic session not found.")
+    return session
 
 @router.patch(
     "/{session_id}",
     response_model=AcademicSessionResponse,
-    summary="Update an academic session (admin only)"
+    summary="Update an academic session (admin only)",
+    dependencies=[Depends(require_admin)],
 )
-async def update_session(
-    session_id: str,
+def update_session(
+    session_id: int,
     session_update: AcademicSessionUpdate,
-    current_user=Depends(get_current_user),
+    db: Session = Depends(get_db),
 ):
     """
     Update session data. Admin only.
     """
-    return await AcademicSessionService.update_session(
-        session_id=session_id, session_update=session_update, user=current_user
-    )
+    session = AcademicSessionService.update(db, session_id, session_update)
+    if session is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Academic session not found.")
+    return session
 
 @router.delete(
     "/{session_id}",
     status_code=status.HTTP_204_NO_CONTENT,
-    summary="Delete an academic session (admin only)"
+    summary="Delete an academic session (admin only)",
+    dependencies=[Depends(require_admin)],
 )
-async def delete_session(
-    session_id: str,
-    current_user=Depends(get_current_user),
+def delete_session(
+    session_id: int,
+    db: Session = Depends(get_db),
 ):
     """
     Delete a session by ID. Admin only.
     """
-    await AcademicSessionService.delete_session(session_id=session_id, user=current_user)
-    return None
\ No newline at end of file
+    if not AcademicSessionService.delete(db, session_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Academic session not found.")
+    return None
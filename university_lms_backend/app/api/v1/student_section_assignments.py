@@ -9,7 +9,9 @@ and enrollment purposes in the University LMS.
 - Staff/admin control all assignment modifications; students can only access their assignments.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session
 from typing import List
 from app.schemas.student_section_assignment import (
     StudentSectionAssignmentCreate,
@@ -18,8 +20,17 @@ from app.schemas.student_section_assignment import (
 )
 from app.services.student_section_assignment_service import StudentSectionAssignmentService
 from app.core.auth import get_current_user
+from app.core.database import get_db
+from app.core.responses import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    json_list_response,
+    set_next_cursor,
+)
+
+router = APIRouter(dependencies=[Depends(get_current_user)])
 
-router = APIRouter()
+_ASSIGNMENT_LIST = TypeAdapter(List[StudentSectionAssignmentResponse])
 
 @router.post(
     "/",
@@ -93,27 +104,48 @@ async def delete_student_section_assignment(
     response_model=List[StudentSectionAssignmentResponse],
     summary="List all section assignments for a student"
 )
-async def list_assignments_for_student(
-    student_id: str,
+def list_assignments_for_student(
+    student_id: int,
+    after: int = Query(0, ge=0, description="Cursor from the previous page's X-Next-Cursor header"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """
-    List all section assignments for a student.
-    Access limited to the student or admin/staff for compliance.
+    List a student's section assignments, one page at a time.
+    Access limited to the student or admin/staff for compliance (enforced in the query).
     """
-    return await StudentSectionAssignmentService.list_assignments_for_student(student_id=student_id, user=current_user)
+    rows = StudentSectionAssignmentService.get_visible_for_student(
+        db, student_id, current_user, after=after, limit=limit
+    )
+    response = json_list_response(_ASSIGNMENT_LIST, rows)
+    set_next_cursor(response, rows, limit, "assignment_id")
+    return response
 
 @router.get(
     "/section-group/{section_group_id}",
     response_model=List[StudentSectionAssignmentResponse],
     summary="List all students assigned to a section group"
 )
-async def list_students_for_section_group(
-    section_group_id: str,
+def list_students_for_section_group(
+    section_group_id: int,
+    after: str = Query(
+        "0:0",
+        pattern=r"^\d+:\d+$",
+        description="student_id:assignment_id cursor from the previous page's X-Next-Cursor header",
+    ),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """
-    Lists all student assignments within a section group.
-    Only staff/admin may view.
+    Lists the student assignments within a section group, one page at a time.
+    Only staff/admin may view (enforced in the query).
     """
-    return await StudentSectionAssignmentService.list_students_for_section_group(section_group_id=section_group_id, user=current_user)
\ No newline at end of file
+    after_student_id, after_assignment_id = (int(part) for part in after.split(":"))
+    rows = StudentSectionAssignmentService.get_visible_for_section_group(
+        db, section_group_id, current_user, after=(after_student_id, after_assignment_id), limit=limit
+    )
+    response = json_list_response(_ASSIGNMENT_LIST, rows)
+    set_next_cursor(response, rows, limit, ("student_id", "assignment_id"))
+    return response
\ No newline at end of file
@@ -5,10 +5,16 @@ Handles user CRUD, profile management, and admin functions for the University LM
 
 - All endpoints leverage unified global schemas and services.
 - Access policy: users may see/update their own info; admins may manage all users.
+- Handlers doing blocking database work are plain `def`, so FastAPI runs them in its threadpool;
+  handlers that write a user are `async` so they can await the cache invalidation, and run
+  the service call in the threadpool themselves.
+- Profile reads are cached in Redis per target user; every write to a user drops that entry.
 - No demos, samples, or test code.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
@@ -19,29 +25,62 @@ from app.schemas.user import (
 )
 from app.schemas.auth import AdminPasswordResetRequest
 from app.services.user_service import UserService
-from app.core.auth import get_current_user
+from app.core.auth import get_current_user, require_admin
+from app.core.auth_cache import (
+    PROFILE_CACHE_EXPIRE_SECONDS,
+    PROFILE_CACHE_NAMESPACE,
+    invalidate_user,
+)
+from app.core.cache import cached
 from app.core.database import get_db
-from app.core.security import get_password_hash
+from app.core.responses import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    json_list_response,
+    set_next_cursor,
+)
+from app.core.security import get_password_hash, run_password_hashing
 from app.repositories.user_repo import UserRepository
 
 router = APIRouter()
 
+# Compiled once; reused by every list response in this router
+_USER_LIST = TypeAdapter(List[UserResponse])
+
+
+async def _cached_profile(db: Session, user_id: int):
+    """
+    The user's profile from the profile cache, loading it on a miss. Raises 404
+    (and caches nothing) if the user does not exist.
+    """
+    async def load():
+        user = await run_in_threadpool(UserService.get_by_id, db, user_id)
+        if user is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found.")
+        return user
+
+    return await cached(PROFILE_CACHE_NAMESPACE, str(user_id), PROFILE_CACHE_EXPIRE_SECONDS, load)
+
 
 @router.get(
     "/",
     response_model=List[UserResponse],
     summary="List all users (admin only)",
+    dependencies=[Depends(require_admin)],
 )
-async def list_users(
+def list_users(
     search: Optional[str] = None,
-    current_user=Depends(get_current_user),
+    after: int = Query(0, ge=0, description="Cursor from the previous page's X-Next-Cursor header"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
 ):
     """
-    List all users. Admins only.
+    List users one page at a time, ordered by user ID. Admins only.
     """
-    if not current_user.is_admin:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required.")
-    return UserService.list_users(search=search)
+    users = UserService.list_users(db, search=search, after=after, limit=limit)
+    response = json_list_response(_USER_LIST, users)
+    set_next_cursor(response, users, limit, "user_id")
+    return response
 
 
 @router.get(
@@ -49,11 +88,14 @@ async def list_users(
     response_model=UserResponse,
     summary="Get current user's profile"
 )
-async def get_me(current_user=Depends(get_current_user)):
+async def get_me(
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
     """
     Retrieve the profile of the currently authenticated user.
     """
-    return UserService.get_by_id(current_user.user_id)
+    return await _cached_profile(db, current_user.user_id)
 
 
 @router.get(
@@ -63,6 +105,7 @@ async def get_me(current_user=Depends(get_current_user)):
 )
 async def get_user(
     user_id: int,
+    db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """
@@ -70,7 +113,7 @@ async def get_user(
     """
     if not (current_user.is_admin or current_user.user_id == user_id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized.")
-    return UserService.get_by_id(user_id)
+    return await _cached_profile(db, user_id)
 
 
 @router.post(
@@ -79,8 +122,9 @@ async def get_user(
     status_code=status.HTTP_201_CREATED,
     summary="Create a user (admin only)",
 )
-async def create_user(
+def create_user(
     user_create: UserCreate,
+    db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """
@@ -88,7 +132,7 @@ async def create_user(
     """
     if not current_user.is_admin:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required.")
-    return UserService.create(user_create)
+    return UserService.create(db, user_create)
 
 
 @router.patch(
@@ -98,12 +142,17 @@ async def create_user(
 )
 async def update_me(
     user_update: UserUpdate,
+    db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """
     User may update their own profile.
     """
-    return UserService.update(current_user.user_id, user_update)
+    user = await run_in_threadpool(UserService.update, db, current_user.user_id, user_update)
+    if user is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found.")
+    await invalidate_user(current_user.user_id)
+    return user
 
 
 @router.patch(
@@ -114,6 +163,7 @@ async def update_me(
 async def update_user(
     user_id: int,
     user_update: UserUpdate,
+    db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """
@@ -121,7 +171,11 @@ async def update_user(
     """
     if not (current_user.is_admin or current_user.user_id == user_id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized.")
-    return UserService.update(user_id, user_update)
+    user = await run_in_threadpool(UserService.update, db, user_id, user_update)
+    if user is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found.")
+    await invalidate_user(user_id)
+    return user
 
 
 @router.patch(
@@ -132,6 +186,7 @@ async def update_user(
 async def update_user_status(
     user_id: int,
     is_active: bool,
+    db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """
@@ -139,7 +194,11 @@ async def update_user_status(
     """
     if not current_user.is_admin:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required.")
-    return UserService.set_status(user_id, is_active)
+    user = await run_in_threadpool(UserService.set_status, db, user_id, is_active)
+    if user is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found.")
+    await invalidate_user(user_id)
+    return user
 
 
 @router.delete(
@@ -149,6 +208,7 @@ async def update_user_status(
 )
 async def delete_user(
     user_id: int,
+    db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """
@@ -156,7 +216,9 @@ async def delete_user(
     """
     if not current_user.is_admin:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required.")
-    UserService.delete(user_id)
+    if not await run_in_threadpool(UserService.delete, db, user_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found.")
+    await invalidate_user(user_id)
     return None
 
 
@@ -178,13 +240,11 @@ async def reset_user_password(
     if not current_user.is_admin:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required.")
     
-    # Check if user exists
-    user = UserRepository.get_by_id(db, user_id)
-    if not user:
+    # Hash on the dedicated password pool, then write it in one statement that also
+    # tells us whether the user exists
+    new_password_hash = await run_password_hashing(get_password_hash, reset_request.new_password)
+    if not await run_in_threadpool(UserRepository.update_password, db, user_id, new_password_hash):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-    
-    # Hash and update the new password
-    new_password_hash = get_password_hash(reset_request.new_password)
-    UserRepository.update(db, user_id, password_hash=new_password_hash)
+    await invalidate_user(user_id)
     
     return None
\ No newline at end of file
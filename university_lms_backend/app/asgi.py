@@ -11,7 +11,11 @@ production deployments.
 - Ensures consistent entrypoint for all app servers.
 
 Usage:
-    uvicorn app.asgi:app --host 0.0.0.0 --port 8000
+    uvicorn app.asgi:app --host 0.0.0.0 --port 8000 --loop uvloop --http httptools
+
+uvloop and httptools come with uvicorn[standard]. Select them with the server flags
+(or gunicorn's uvicorn worker, which picks them automatically): the server creates the
+event loop before importing this module, so installing a loop policy here has no effect.
 """
 
 import os
@@ -4,16 +4,18 @@ University LMS Backend - Configuration Loader (Production)
 Centralizes all application and infrastructure settings.
 
 - Loads values from environment variables and .env files using Pydantic for validation.
-- Provides a single global config object, used throughout app for consistency.
+- Provides a single global config object, used throughout app for consistency
+  (app.core.config re-exports it).
+- Frozen: settings are read-only after load, so every import sees the same values.
 - Never hardcodes secrets; all are sourced securely.
 """
 
 import os
-from typing import List, Optional, Union
-from functools import lru_cache
+from typing import List, Optional, Tuple, Union
+from functools import cached_property, lru_cache
 
 from pydantic_settings import BaseSettings
-from pydantic import Field, AnyHttpUrl, field_validator
+from pydantic import Field, AnyHttpUrl, field_validator, model_validator
 
 class Settings(BaseSettings):
     # Core Project and Environment
@@ -28,6 +30,11 @@ class Settings(BaseSettings):
     POSTGRES_HOST: str = "localhost"
     POSTGRES_PORT: int = 5432
     DATABASE_URL: str = "sqlite:///./test.db"
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_TIMEOUT_SECONDS: int = 10  # Fail fast with an error instead of queueing when the pool is exhausted
+    DB_POOL_RECYCLE_SECONDS: int = 1800  # Recycle before server/pgbouncer idle timeouts drop connections
+    DB_STATEMENT_TIMEOUT_MS: int = 5000  # PostgreSQL only; 0 disables
 
     # JWT/Auth
     JWT_SECRET_KEY: str = "INSECURE_DEV_SECRET_CHANGE_IN_PRODUCTION"
@@ -67,6 +74,7 @@ class Settings(BaseSettings):
 
     # Logging
     LOG_LEVEL: str = "INFO"
+    SLOW_QUERY_THRESHOLD_MS: int = 100  # SQL statements slower than this are logged as warnings
 
     # Feature Flags & Misc
     # SENTRY_DSN: Optional[str] = None
@@ -75,14 +83,18 @@ class Settings(BaseSettings):
 
     model_config = {
         "env_file": ".env",
-        "case_sensitive": True
+        "case_sensitive": True,
+        "extra": "ignore",
+        "frozen": True,
     }
-    
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # Set aliases
-        if not self.SECRET_KEY:
-            self.SECRET_KEY = self.JWT_SECRET_KEY
+
+    @model_validator(mode="before")
+    @classmethod
+    def alias_secret_key(cls, data):
+        # SECRET_KEY defaults to JWT_SECRET_KEY
+        if isinstance(data, dict) and not data.get("SECRET_KEY"):
+            data = {**data, "SECRET_KEY": data.get("JWT_SECRET_KEY", cls.model_fields["JWT_SECRET_KEY"].default)}
+        return data
 
     @field_validator("ALLOWED_ORIGINS", mode="before")
     @classmethod
@@ -101,10 +113,10 @@ class Settings(BaseSettings):
             return os.path.join(base_dir, path)
         return path
 
-    @property
-    def allowed_upload_types(self) -> List[str]:
-        """List of allowed upload mime/file types."""
-        return [typ.strip() for typ in self.ALLOWED_UPLOAD_MIME_TYPES.split(",")]
+    @cached_property
+    def allowed_upload_types(self) -> Tuple[str, ...]:
+        """Allowed upload mime/file types, split once per Settings instance."""
+        return tuple(typ.strip() for typ in self.ALLOWED_UPLOAD_MIME_TYPES.split(",") if typ.strip())
 
 @lru_cache()
 def get_settings() -> Settings:
@@ -112,4 +124,7 @@ def get_settings() -> Settings:
     Returns a singleton instance of Settings loaded from env.
     Use import and call get_settings() anywhere in the app.
     """
-    return Settings()
\ No newline at end of file
+    return Settings()
+
+# Usage: from app.config import settings
+settings = get_settings()
\ No newline at end of file
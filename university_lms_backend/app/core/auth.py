@@ -9,27 +9,49 @@ Central authentication and authorization logic for University LMS backend.
 - No samples, demos, or dev/test code.
 """
 
+import hashlib
+import threading
+import time
+
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status, Request
-from jose import jwt, JWTError
+from fastapi.concurrency import run_in_threadpool
+import jwt
+from jwt import PyJWTError as JWTError
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import Optional, Tuple
+from app.core.auth_cache import cache_user, get_cached_user
 from app.core.config import settings
 from app.models.user import User
 from app.core.database import get_db
-from app.services.user_service import UserService
+from app.core.permissions import get_rbac_cache
+from app.services.role_service import RoleService
+
+# Verified token -> (user_id, exp). Skips re-decoding the same JWT when the resolved
+# user is not in the Redis auth cache (see app.core.auth_cache).
+TOKEN_CACHE_TTL_SECONDS: int = 60
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=TOKEN_CACHE_TTL_SECONDS)
+_token_cache_lock = threading.Lock()
+
+_BEARER_PREFIX = "Bearer "
+_BEARER_PREFIX_LEN = len(_BEARER_PREFIX)
+
+# Every token we issue carries sub and exp; audiences are not used
+_DECODE_OPTIONS = {"require": ["exp", "sub"], "verify_aud": False}
 
 def get_token_from_header(request: Request) -> str:
     """
     Extracts the JWT token from the Authorization header.
     Raises if header missing or not Bearer type.
     """
-    auth_header: str = request.headers.get("Authorization")
-    if not auth_header or not auth_header.startswith("Bearer "):
+    auth_header: str = request.headers.get("Authorization", "")
+    # One prefix compare and slice; this runs on every authenticated request
+    if len(auth_header) <= _BEARER_PREFIX_LEN or auth_header[:_BEARER_PREFIX_LEN] != _BEARER_PREFIX:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authorization header missing or invalid.",
         )
-    return auth_header.split(" ", 1)[1]
+    return auth_header[_BEARER_PREFIX_LEN:]
 
 def decode_jwt_token(token: str) -> dict:
     """
@@ -41,6 +63,7 @@ def decode_jwt_token(token: str) -> dict:
             token,
             settings.SECRET_KEY,
             algorithms=[settings.ALGORITHM],
+            options=_DECODE_OPTIONS,
         )
         return payload
     except JWTError:
@@ -49,15 +72,27 @@ def decode_jwt_token(token: str) -> dict:
             detail="Could not validate credentials.",
         )
 
-async def get_current_user(
-    request: Request,
-    db: Session = Depends(get_db),
-) -> User:
+def clear_token_cache() -> None:
     """
-    Retrieves the current authenticated user from the JWT in the Authorization header.
-    Raises HTTP 401 or 403 if missing/invalid or inactive.
+    Drops every cached token resolution (e.g. after a secret rotation, or between tests).
     """
-    token = get_token_from_header(request)
+    with _token_cache_lock:
+        _token_cache.clear()
+
+def resolve_token(token: str) -> Tuple[int, Optional[float]]:
+    """
+    Returns the user ID and expiry (epoch seconds, or None) carried by a valid JWT,
+    decoding it at most once per cache TTL.
+    Raises HTTP 401 if the token is invalid or its subject is not a user ID.
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+    if cached is not None:
+        user_id_int, expires_at = cached
+        if expires_at is None or expires_at > time.time():
+            return cached
+
     payload = decode_jwt_token(token)
     user_id: Optional[str] = payload.get("sub")
     if not user_id:
@@ -72,20 +107,69 @@ async def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token payload invalid.",
         )
-    # Query the actual model object to get relationships and properties
+    resolved = (user_id_int, payload.get("exp"))
+    with _token_cache_lock:
+        _token_cache[key] = resolved
+    return resolved
+
+def resolve_token_user_id(token: str) -> int:
+    """
+    Returns the user ID carried by a valid JWT (see resolve_token).
+    """
+    return resolve_token(token)[0]
+
+def _load_active_user(token: str, db: Session) -> Tuple[User, Optional[float]]:
+    """
+    Verifies the token and loads its active user, returning it with the token's expiry.
+    Blocking (JWT crypto + sync DB query), so get_current_user runs it in the threadpool.
+    """
+    user_id_int, expires_at = resolve_token(token)
+    # Query the actual model object, with its role, so permission checks stay in memory
     from app.repositories.user_repo import UserRepository
-    user = UserRepository.get_by_id(db=db, user_id=user_id_int)
+    user = UserRepository.get_with_role(db=db, user_id=user_id_int)
     if user is None or not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="User not active or does not exist.",
         )
+    return user, expires_at
+
+async def get_current_user(
+    request: Request,
+    db: Session = Depends(get_db),
+) -> User:
+    """
+    Retrieves the current authenticated user from the JWT in the Authorization header.
+    Raises HTTP 401 or 403 if missing/invalid or inactive.
+    The user is memoized on request.state, so it is resolved at most once per request.
+    It comes from the Redis auth cache when possible (attached to `db` with its role,
+    without a query); otherwise the blocking verify+load step runs off the event loop and fills the cache.
+    The request's RBACCache is attached as `user.rbac_cache` for services that check
+    per-resource permissions.
+    Routers whose every route needs a signed-in user also declare it router-wide,
+    `APIRouter(dependencies=[Depends(get_current_user)])`, so a route added later cannot
+    ship unauthenticated; FastAPI resolves it once per request and shares the result
+    with routes that also take `current_user=Depends(get_current_user)`.
+    """
+    cached_user = getattr(request.state, "current_user", None)
+    if isinstance(cached_user, User):
+        return cached_user
+
+    token = get_token_from_header(request)
+    user = await get_cached_user(token, db)
+    if user is None:
+        user, expires_at = await run_in_threadpool(_load_active_user, token, db)
+        await cache_user(token, user, expires_at)
+    user.rbac_cache = get_rbac_cache(request)
+    request.state.current_user = user
     return user
 
 def require_role(required_roles: list):
     """
     Dependency factory to enforce that the current user has one of the given roles.
     Usage: Depends(require_role(["admin", "professor"]))
+    Build the dependency once at module level and reuse it: FastAPI caches a
+    dependency per request by identity, so a shared instance runs only once.
     """
     async def role_dependency(
         current_user: User = Depends(get_current_user)
@@ -98,4 +182,12 @@ def require_role(required_roles: list):
                 detail=f"User lacks required role(s): {required_roles}",
             )
         return current_user
-    return role_dependency
\ No newline at end of file
+    return role_dependency
+
+async def require_admin(current_user: User = Depends(get_current_user)) -> User:
+    """
+    Dependency that returns the current user if they are an administrator, else 403.
+    Usage: current_user=Depends(require_admin)
+    """
+    RoleService.require_admin(current_user)
+    return current_user
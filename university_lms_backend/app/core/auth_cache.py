@@ -0,0 +1,110 @@
+"""
+Authenticated User Cache (Production)
+-------------------------------------
+Redis cache of the users resolved by get_current_user, keyed by a hash of the bearer token.
+
+- A hit skips both the JWT verification and the users/roles query.
+- Entries live no longer than AUTH_CACHE_TTL_SECONDS and never past the token's own expiry.
+- Only active users are cached; writes that change a user (status, role, profile,
+  password, deletion) drop every cached token of that user via a per-user index set,
+  along with the user's cached profile response.
+- Fails open: if Redis is unreachable the user is loaded from the database as before.
+- No samples, demos, or legacy/test logic.
+"""
+
+import hashlib
+import logging
+import time
+from typing import Optional
+
+import orjson
+from redis.exceptions import RedisError
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.cache import CACHE_PREFIX, forget, get_redis
+from app.models.role import Role
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on how long a token's resolved user is reused, even for long-lived tokens
+AUTH_CACHE_TTL_SECONDS: int = 300
+
+# Cached GET /users/{id} and /users/me bodies, keyed by the profile's user_id
+PROFILE_CACHE_NAMESPACE: str = "users"
+PROFILE_CACHE_EXPIRE_SECONDS: int = 300
+
+# User columns carried in a cache entry; enough for every permission check and service call
+_USER_FIELDS = ("user_id", "username", "email", "first_name", "last_name", "role_id", "is_active")
+
+def _token_key(token: str) -> str:
+    return f"{CACHE_PREFIX}:auth:{hashlib.blake2b(token.encode(), digest_size=16).hexdigest()}"
+
+def _user_index_key(user_id: int) -> str:
+    return f"{CACHE_PREFIX}:auth:user:{user_id}"
+
+def _attach(db: Session, obj):
+    """
+    Merges a rebuilt row into `db` as persistent without querying; columns not set on
+    `obj` are left unloaded and load lazily like on any other row.
+    """
+    make_transient_to_detached(obj)
+    return db.merge(obj, load=False)
+
+async def get_cached_user(token: str, db: Session) -> Optional[User]:
+    """
+    Returns the user cached for `token`, or None. The user (and its role) is attached
+    to `db` without a query, so it behaves like a row loaded by the request's session.
+    """
+    key = _token_key(token)
+    try:
+        raw = await get_redis().get(key)
+    except RedisError as exc:
+        logger.warning("Auth cache read failed: %s", exc)
+        return None
+    if raw is None:
+        return None
+    data = orjson.loads(raw)
+    role = data.pop("role")
+    user = _attach(db, User(**data))
+    # Set without history, so the role is neither re-flushed nor lazily re-selected
+    set_committed_value(user, "role", _attach(db, Role(**role)) if role is not None else None)
+    return user
+
+async def cache_user(token: str, user: User, expires_at: Optional[float]) -> None:
+    """
+    Stores `user` under `token` until the token expires (at most AUTH_CACHE_TTL_SECONDS),
+    and indexes the entry under the user so invalidate_user can find it.
+    """
+    ttl = AUTH_CACHE_TTL_SECONDS
+    if expires_at is not None:
+        ttl = min(ttl, int(expires_at - time.time()))
+    if ttl <= 0 or not user.is_active:
+        return
+    data = {field: getattr(user, field) for field in _USER_FIELDS}
+    data["role"] = {"role_id": user.role.role_id, "name": user.role.name} if user.role else None
+    key = _token_key(token)
+    index_key = _user_index_key(user.user_id)
+    try:
+        async with get_redis().pipeline(transaction=True) as pipe:
+            pipe.set(key, orjson.dumps(data), ex=ttl)
+            pipe.sadd(index_key, key)
+            pipe.expire(index_key, AUTH_CACHE_TTL_SECONDS)
+            await pipe.execute()
+    except RedisError as exc:
+        logger.warning("Auth cache write failed: %s", exc)
+
+async def invalidate_user(user_id: int) -> None:
+    """
+    Drops every cached token resolution and the cached profile of `user_id`,
+    so the next request reloads the user.
+    """
+    index_key = _user_index_key(user_id)
+    client = get_redis()
+    try:
+        keys = await client.smembers(index_key)
+        await client.delete(index_key, *keys)
+    except RedisError as exc:
+        logger.warning("Auth cache invalidation failed for user %s: %s", user_id, exc)
+    await forget(PROFILE_CACHE_NAMESPACE, str(user_id))
@@ -0,0 +1,219 @@
+"""
+Response Cache (Production)
+---------------------------
+Redis-backed cache for high-volume, low-volatility read endpoints of the University LMS.
+
+- Entries are grouped by namespace (e.g. "catalog", "departments") so writes can invalidate them.
+- Shared views must never be keyed by the caller; scope them by role at most. Per-record
+  entries (e.g. one user's profile) are keyed by the record and access-checked before reading.
+- Fails open: if Redis is unreachable the loader is called and the request still succeeds.
+- Stale-while-revalidate entries are stored as encoded JSON bytes and served without re-serialization,
+  together with an ETag computed from those bytes when the entry is filled.
+- Clearing a namespace is broadcast over pub/sub so every worker can drop its in-process copies.
+- No samples, demos, or legacy/test logic.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+import orjson
+import redis.asyncio as aioredis
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from redis.exceptions import RedisError
+
+from app.config import get_settings
+from app.core.responses import body_etag
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX: str = "lms"
+
+# Pub/sub channel carrying namespace names whose cached data changed
+INVALIDATION_CHANNEL: str = f"{CACHE_PREFIX}:invalidate"
+# Seconds to wait before resubscribing after the Redis connection drops
+INVALIDATION_RETRY_SECONDS: int = 5
+
+# How long a background refresh holds its lock, so concurrent requests don't all reload
+SWR_REFRESH_LOCK_SECONDS: int = 30
+
+_redis: Optional[aioredis.Redis] = None
+# Strong references to in-flight refreshes; the event loop only keeps weak ones
+_refresh_tasks: set = set()
+# In-process caches to rebuild when their namespace is invalidated (namespace -> async callback)
+_invalidation_handlers: dict[str, Callable[[], Awaitable[None]]] = {}
+
+def get_redis() -> aioredis.Redis:
+    """
+    Returns the shared Redis client, creating it on first use.
+    """
+    global _redis
+    if _redis is None:
+        _redis = aioredis.from_url(
+            get_settings().REDIS_URL,
+            socket_connect_timeout=0.5,
+            socket_timeout=0.5,
+        )
+    return _redis
+
+async def close_redis() -> None:
+    """
+    Closes the shared Redis client (called on application shutdown).
+    """
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+
+def _cache_key(namespace: str, key: str) -> str:
+    return f"{CACHE_PREFIX}:{namespace}:{key}"
+
+async def cached(
+    namespace: str,
+    key: str,
+    expire: int,
+    loader: Callable[[], Awaitable[Any]],
+) -> Any:
+    """
+    Returns the JSON-decoded value stored under `namespace:key`, or awaits `loader`,
+    stores its JSON-encoded result for `expire` seconds, and returns it.
+    """
+    redis_key = _cache_key(namespace, key)
+    try:
+        hit = await get_redis().get(redis_key)
+    except RedisError as exc:
+        logger.warning("Cache read failed for %s: %s", redis_key, exc)
+        return await loader()
+    if hit is not None:
+        return orjson.loads(hit)
+
+    value = jsonable_encoder(await loader())
+    try:
+        await get_redis().set(redis_key, orjson.dumps(value), ex=expire)
+    except RedisError as exc:
+        logger.warning("Cache write failed for %s: %s", redis_key, exc)
+    return value
+
+async def forget(namespace: str, key: str) -> None:
+    """
+    Deletes the single entry `namespace:key` (e.g. after that record changed).
+    """
+    redis_key = _cache_key(namespace, key)
+    try:
+        await get_redis().delete(redis_key)
+    except RedisError as exc:
+        logger.warning("Cache delete failed for %s: %s", redis_key, exc)
+
+async def _store_swr(redis_key: str, body: bytes, etag: str, fresh_for: int, stale_for: int) -> None:
+    async with get_redis().pipeline(transaction=True) as pipe:
+        pipe.hset(redis_key, mapping={"body": body, "etag": etag, "fresh_until": time.time() + fresh_for})
+        pipe.expire(redis_key, fresh_for + stale_for)
+        await pipe.execute()
+
+async def _refresh_swr(
+    redis_key: str,
+    loader: Callable[[], Awaitable[Any]],
+    fresh_for: int,
+    stale_for: int,
+) -> None:
+    try:
+        body = orjson.dumps(jsonable_encoder(await loader()))
+        await _store_swr(redis_key, body, body_etag(body), fresh_for, stale_for)
+    except Exception:
+        logger.exception("Background cache refresh failed for %s", redis_key)
+    finally:
+        try:
+            await get_redis().delete(f"{redis_key}:refreshing")
+        except RedisError:
+            pass
+
+async def cached_json_response(
+    namespace: str,
+    key: str,
+    fresh_for: int,
+    stale_for: int,
+    loader: Callable[[], Awaitable[Any]],
+) -> Response:
+    """
+    Stale-while-revalidate JSON cache. Entries younger than `fresh_for` seconds are served
+    as-is; for a further `stale_for` seconds they are still served immediately while one
+    background task reloads them, so `loader` must not depend on the request's session.
+    The stored bytes are returned directly as the response body, with the ETag stored
+    alongside them in the `ETag` header.
+    """
+    redis_key = _cache_key(namespace, key)
+    client = get_redis()
+    try:
+        body, etag, fresh_until = await client.hmget(redis_key, ["body", "etag", "fresh_until"])
+    except RedisError as exc:
+        logger.warning("Cache read failed for %s: %s", redis_key, exc)
+        body = etag = fresh_until = None
+
+    if body is not None and etag is not None:
+        if float(fresh_until) < time.time():
+            try:
+                # Only one request per entry schedules the refresh
+                if await client.set(f"{redis_key}:refreshing", 1, nx=True, ex=SWR_REFRESH_LOCK_SECONDS):
+                    task = asyncio.create_task(_refresh_swr(redis_key, loader, fresh_for, stale_for))
+                    _refresh_tasks.add(task)
+                    task.add_done_callback(_refresh_tasks.discard)
+            except RedisError as exc:
+                logger.warning("Cache refresh lock failed for %s: %s", redis_key, exc)
+        return Response(content=body, media_type="application/json", headers={"ETag": etag.decode()})
+
+    body = orjson.dumps(jsonable_encoder(await loader()))
+    etag = body_etag(body)
+    try:
+        await _store_swr(redis_key, body, etag, fresh_for, stale_for)
+    except RedisError as exc:
+        logger.warning("Cache write failed for %s: %s", redis_key, exc)
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+def register_invalidation_handler(namespace: str, handler: Callable[[], Awaitable[None]]) -> None:
+    """
+    Registers `handler` to run in this process whenever `namespace` is cleared by any worker.
+    """
+    _invalidation_handlers[namespace] = handler
+
+async def _run_invalidation_handler(namespace: str) -> None:
+    handler = _invalidation_handlers.get(namespace)
+    if handler is None:
+        return
+    try:
+        await handler()
+    except Exception:
+        logger.exception("Invalidation handler failed for namespace %s", namespace)
+
+async def clear_namespace(namespace: str) -> None:
+    """
+    Deletes every cached entry in `namespace` and tells every worker to rebuild
+    its in-process copy. If Redis is unreachable, only this worker is refreshed.
+    """
+    client = get_redis()
+    try:
+        keys = [k async for k in client.scan_iter(match=_cache_key(namespace, "*"), count=500)]
+        if keys:
+            await client.delete(*keys)
+        await client.publish(INVALIDATION_CHANNEL, namespace)
+    except RedisError as exc:
+        logger.warning("Cache invalidation failed for namespace %s: %s", namespace, exc)
+        await _run_invalidation_handler(namespace)
+
+async def listen_for_invalidations() -> None:
+    """
+    Long-running task: runs the registered handler for each namespace published on
+    INVALIDATION_CHANNEL (including this worker's own publishes). Resubscribes after
+    connection errors; cancel it on shutdown.
+    """
+    while True:
+        try:
+            async with get_redis().pubsub() as pubsub:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        await _run_invalidation_handler(message["data"].decode())
+        except RedisError as exc:
+            logger.warning("Invalidation listener disconnected: %s", exc)
+            await asyncio.sleep(INVALIDATION_RETRY_SECONDS)
@@ -7,9 +7,14 @@ Provides database session management and connection pooling for the University L
 - Provides get_db() generator for dependency injection
 - Configured for production use with proper connection pooling
 - Uses lazy initialization to avoid loading settings at import time
+- Logs statements slower than SLOW_QUERY_THRESHOLD_MS so regressions are caught
 """
 
-from sqlalchemy import create_engine
+import logging
+import time
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session
 from typing import Generator
 from functools import lru_cache
@@ -25,16 +30,43 @@ except ImportError:
 
 from app.models.base import Base
 
+slow_query_logger = logging.getLogger("app.sql.slow")
+
+def install_slow_query_log(engine: Engine, threshold_ms: int) -> None:
+    """
+    Time every statement on `engine` and log those exceeding `threshold_ms`.
+    """
+    threshold = threshold_ms / 1000.0
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _log_if_slow(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+        if elapsed >= threshold:
+            slow_query_logger.warning("Slow query (%.1f ms): %s", elapsed * 1000, statement)
+
 @lru_cache(maxsize=1)
 def get_engine():
     """Get or create the database engine (lazy initialization, thread-safe singleton)."""
     settings = get_settings()
-    return create_engine(
+    connect_args = {}
+    if settings.DATABASE_URL.startswith("postgresql") and settings.DB_STATEMENT_TIMEOUT_MS:
+        # Bound runaway queries server-side so they cannot pin pooled connections
+        connect_args["options"] = f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"
+    engine = create_engine(
         settings.DATABASE_URL,
         pool_pre_ping=True,  # Verify connections before using them
-        pool_size=10,
-        max_overflow=20
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        connect_args=connect_args,
     )
+    install_slow_query_log(engine, settings.SLOW_QUERY_THRESHOLD_MS)
+    return engine
 
 @lru_cache(maxsize=1)
 def get_session_local():
@@ -45,6 +77,8 @@ def get_session_local():
 def get_db() -> Generator[Session, None, None]:
     """
     Database session generator for dependency injection.
+    FastAPI caches dependencies per request, so get_current_user and the endpoint
+    share this one session (and pooled connection) rather than checking out two.
     
     Usage:
         @app.get("/endpoint")
@@ -0,0 +1,50 @@
+"""
+ASGI Middleware (Production)
+----------------------------
+Request-level middleware shared by the University LMS backend app factory.
+
+- Implemented as plain ASGI callables so they run before FastAPI parses the request body.
+- No samples, demos, or legacy/test logic.
+"""
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.security import MAX_UPLOAD_SIZE
+
+# Room for multipart boundaries and part headers on top of the file itself
+MULTIPART_OVERHEAD: int = 64 * 1024
+
+class UploadSizeLimitMiddleware:
+    """
+    Rejects multipart uploads whose declared Content-Length exceeds the upload limit.
+    FastAPI spools the whole multipart body before any endpoint or dependency runs,
+    so this is the only point where an oversized upload can be refused without reading it.
+    Streams without a Content-Length are still bounded by the per-file checks.
+    """
+
+    def __init__(self, app: ASGIApp, max_size: int = MAX_UPLOAD_SIZE):
+        self.app = app
+        self.max_body_size = max_size + MULTIPART_OVERHEAD
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["method"] in ("POST", "PUT", "PATCH"):
+            content_type = b""
+            content_length = b""
+            for name, value in scope["headers"]:
+                if name == b"content-type":
+                    content_type = value
+                elif name == b"content-length":
+                    content_length = value
+            if (
+                content_type.startswith(b"multipart/form-data")
+                and content_length.isdigit()
+                and int(content_length) > self.max_body_size
+            ):
+                response = JSONResponse(
+                    status_code=413,
+                    content={"detail": "File is too large."},
+                )
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
@@ -0,0 +1,90 @@
+"""
+Row-Level Permissions (Production)
+----------------------------------
+SQL predicates for course-staff access checks in the University LMS backend.
+
+- Access rules are expressed as WHERE clauses so the database returns only rows the
+  caller may see, instead of fetching rows and filtering (or re-querying) per row.
+- Decisions for a single resource are memoized per request in an RBACCache, so repeated
+  checks within one request hit the database once.
+- No samples, demos, or legacy/test logic.
+"""
+
+from typing import Any, Callable, Hashable
+
+from fastapi import Request
+from sqlalchemy import ColumnElement, exists, or_, select
+
+from app.models.associate_teacher import AssociateTeacher
+from app.models.professor import Professor
+
+def is_offering_staff(offering_id: Any, user_id: Any) -> ColumnElement[bool]:
+    """
+    Predicate that is true when `user_id` is a professor or associate teacher of the
+    course offering `offering_id`. Both arguments may be columns or bind parameters,
+    so the check can correlate with the rows of an outer query.
+    """
+    return or_(
+        exists(
+            select(Professor.professor_id).where(
+                Professor.course_offering_id == offering_id,
+                Professor.user_id == user_id,
+            )
+        ),
+        exists(
+            select(AssociateTeacher.assoc_teacher_id).where(
+                AssociateTeacher.course_offering_id == offering_id,
+                AssociateTeacher.user_id == user_id,
+            )
+        ),
+    )
+
+class RBACCache:
+    """
+    Request-scoped memo of permission decisions keyed by (user_id, permission, resource_id).
+    Lives on request.state, so it is discarded with the request and needs no TTL.
+    """
+
+    def __init__(self) -> None:
+        self._decisions: dict[tuple[Any, str, Hashable], bool] = {}
+
+    def get_or_compute(self, key: tuple[Any, str, Hashable], compute: Callable[[], bool]) -> bool:
+        """
+        Returns the cached decision for `key`, evaluating `compute` on first use.
+        """
+        try:
+            return self._decisions[key]
+        except KeyError:
+            decision = self._decisions[key] = bool(compute())
+            return decision
+
+    def invalidate(self, permission_prefix: str, resource_id: Hashable) -> None:
+        """
+        Drops cached decisions on `resource_id` for every permission starting with
+        `permission_prefix` (e.g. "quiz:"), after a mutation changes who may access it.
+        """
+        stale = [
+            key for key in self._decisions
+            if key[2] == resource_id and key[1].startswith(permission_prefix)
+        ]
+        for key in stale:
+            del self._decisions[key]
+
+def get_rbac_cache(request: Request) -> RBACCache:
+    """
+    Returns the RBACCache for this request, creating it on first use.
+    """
+    cache = getattr(request.state, "rbac_cache", None)
+    if not isinstance(cache, RBACCache):
+        cache = request.state.rbac_cache = RBACCache()
+    return cache
+
+def cached_decision(user: Any, permission: str, resource_id: Hashable, compute: Callable[[], bool]) -> bool:
+    """
+    Evaluates `compute` through the user's request-scoped RBACCache (attached by
+    get_current_user), or directly if the user carries none.
+    """
+    cache = getattr(user, "rbac_cache", None)
+    if cache is None:
+        return bool(compute())
+    return cache.get_or_compute((user.user_id, permission, resource_id), compute)
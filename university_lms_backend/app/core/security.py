@@ -9,8 +9,11 @@ Centralized, production-grade security helpers for the University LMS backend.
 """
 
 from fastapi import HTTPException, status, UploadFile
-from typing import List
+from typing import Any, Callable, List
 from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import os
 import secrets
 import string
 import re
@@ -41,27 +44,21 @@ def validate_upload_file(file: UploadFile, max_size: int = MAX_UPLOAD_SIZE):
             detail=f"File type not allowed. Allowed: {', '.join(ALLOWED_EXTENSIONS)}",
         )
 
-    # Content length validation (streamed uploads may not always have .spooled size)
-    if hasattr(file.file, "fileno"):
+    # Size check from metadata: Starlette records the size while spooling the multipart
+    # body, so the payload is not read here. Seeking is only a fallback for other file objects.
+    size = file.size
+    if size is None and hasattr(file.file, "seek"):
         try:
             pos = file.file.tell()
-            file.file.seek(0, 2)  # Go to end of file
-            size = file.file.tell()
+            size = file.file.seek(0, 2)
             file.file.seek(pos)
-            if size > max_size:
-                raise HTTPException(
-                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                    detail="File is too large.",
-                )
-        except Exception:
-            pass  # Fallback for non-seekable streams
-    elif hasattr(file.file, "getbuffer"):
-        size = len(file.file.getbuffer())
-        if size > max_size:
-            raise HTTPException(
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                detail="File is too large.",
-            )
+        except (OSError, ValueError):
+            size = None  # Non-seekable stream; save_upload_file enforces the limit while copying
+    if size is not None and size > max_size:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="File is too large.",
+        )
 
 def hash_password(password: str) -> str:
     """
@@ -79,6 +76,20 @@ def get_password_hash(password: str) -> str:
     """
     return hash_password(password)
 
+# PBKDF2 runs inside OpenSSL with the GIL released, so these threads hash in parallel
+# across cores without the pickling/fork cost of a process pool. Keeping them separate from
+# the shared threadpool stops a login burst from starving sync endpoints.
+_password_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="password-hash",
+)
+
+async def run_password_hashing(func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Runs a password hash/verify call on the dedicated, CPU-sized password pool.
+    """
+    return await asyncio.get_running_loop().run_in_executor(_password_executor, func, *args)
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verifies a plaintext password against a stored hash.
@@ -92,7 +103,7 @@ def create_access_token(data: dict, expires_delta: timedelta = None) -> str:
     """
     Create a JWT access token with optional expiration.
     """
-    from jose import jwt
+    import jwt
     from datetime import datetime, timedelta
     from app.core.config import settings
     
@@ -100,7 +111,7 @@ def create_access_token(data: dict, expires_delta: timedelta = None) -> str:
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = datetime.utcnow() + timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRES_MINUTES)
     
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
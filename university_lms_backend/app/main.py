@@ -9,6 +9,9 @@ Creates and configures the FastAPI app.
 - Provides a single `create_app()` factory for both ASGI servers and CLI tools.
 """
 
+import asyncio
+import contextlib
+import logging
 import os
 import sys
 import subprocess
@@ -16,9 +19,15 @@ from pathlib import Path
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 
 from app.config import get_settings
+from app.core.cache import close_redis, listen_for_invalidations, register_invalidation_handler
+from app.core.database import get_engine
+from app.core.middleware import UploadSizeLimitMiddleware
+from app.core.responses import NEXT_CURSOR_HEADER
 
 # Import unified domain routers (all production, no samples or demos)
 from app.api.v1.auth import router as auth_router
@@ -26,7 +35,8 @@ from app.api.v1.users import router as users_router
 from app.api.v1.roles import router as roles_router
 from app.api.v1.courses import router as courses_router
 from app.api.v1.offerings import router as offerings_router
-from app.api.v1.departments import router as departments_router
+from app.api.v1.departments import router as departments_router, DEPARTMENTS_CACHE_NAMESPACE
+from app.services.department_service import DepartmentService
 from app.api.v1.sessions import router as sessions_router
 from app.api.v1.assignments import router as assignments_router
 from app.api.v1.assignment_files import router as assignment_files_router
@@ -43,13 +53,26 @@ from app.api.v1.rooms import router as rooms_router
 from app.api.v1.files import router as files_router
 from app.api.v1.notifications import router as notifications_router
 
+logger = logging.getLogger(__name__)
+
+
+async def _reload_department_cache() -> None:
+    count = await run_in_threadpool(DepartmentService.reload_cache)
+    logger.info("Department cache loaded (%d departments)", count)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Lifespan context manager for startup and shutdown events.
-    Runs database seeding on startup if SEED_ON_STARTUP environment variable is set.
+    Runs database seeding on startup if SEED_ON_STARTUP environment variable is set,
+    pre-warms the department cache, and listens for cross-worker cache invalidations.
     """
+    # Confirms the server picked uvloop (`--loop uvloop`) rather than the pure-Python loop
+    loop = asyncio.get_running_loop()
+    logger.info("Event loop: %s.%s", type(loop).__module__, type(loop).__qualname__)
+    # Pool limits per worker; multiply by the worker count to size max_connections or pgbouncer
+    logger.info("Database pool: %s", get_engine().pool.status())
+
     # Startup: Run database seeding if enabled
     if os.environ.get('SEED_ON_STARTUP', '').lower() in ('true', '1', 'yes'):
         print("🌱 SEED_ON_STARTUP is enabled, running database seeding...")
@@ -78,10 +101,21 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             print(f"❌ Error running database seeding: {e}")
     
+    # Pre-warm per-worker caches; requests fall back to the database if this fails
+    register_invalidation_handler(DEPARTMENTS_CACHE_NAMESPACE, _reload_department_cache)
+    try:
+        await _reload_department_cache()
+    except Exception as e:
+        logger.warning("Department cache not pre-warmed: %s", e)
+    invalidation_listener = asyncio.create_task(listen_for_invalidations())
+    
     yield  # Application runs here
     
-    # Shutdown: Cleanup tasks if needed
-    pass
+    # Shutdown: stop the invalidation listener and release the shared Redis connection pool
+    invalidation_listener.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await invalidation_listener
+    await close_redis()
 
 
 def create_app(environment: str = None) -> FastAPI:
@@ -97,8 +131,18 @@ def create_app(environment: str = None) -> FastAPI:
         redoc_url="/redoc",
         openapi_url="/openapi.json",
         lifespan=lifespan,
+        # No default_response_class: with the default, routes with a response_model are
+        # validated and dumped to JSON bytes by pydantic-core in one pass. A custom class
+        # (e.g. ORJSONResponse) forces the slower jsonable_encoder round trip instead.
     )
 
+    # Refuse oversized uploads from their headers, before the body is spooled.
+    # Added first so CORS wraps it and the 413 still carries CORS headers.
+    app.add_middleware(UploadSizeLimitMiddleware)
+
+    # Compress JSON list responses; bodies under 1 KB are not worth the CPU
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+
     # Set up CORS from settings
     app.add_middleware(
         CORSMiddleware,
@@ -108,6 +152,7 @@ def create_app(environment: str = None) -> FastAPI:
         allow_credentials=True,
         allow_methods=settings.ALLOWED_METHODS.split(","),
         allow_headers=settings.ALLOWED_HEADERS.split(","),
+        expose_headers=[NEXT_CURSOR_HEADER],
     )
 
     # Healthcheck endpoint (simple, no auth)
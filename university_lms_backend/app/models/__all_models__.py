@@ -1,5 +1,7 @@
 # Import all models to ensure relationships are properly configured
 # This must happen before any database queries
+from sqlalchemy.orm import configure_mappers
+
 from app.models.base import Base  # noqa: F401
 from app.models.role import Role  # noqa: F401
 from app.models.specialization import Specialization  # noqa: F401
@@ -31,6 +33,9 @@ from app.models.uploaded_file import UploadedFile  # noqa: F401
 from app.models.associate_teacher import AssociateTeacher  # noqa: F401
 from app.models.admin import Admin  # noqa: F401
 
+# Resolve all relationships in a single pass now that every mapper is registered
+configure_mappers()
+
 __all__ = [
     "Base",
     "Role",
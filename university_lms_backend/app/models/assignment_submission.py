@@ -8,7 +8,7 @@ Represents a student's submitted work (file and/or digital entry) for an assignm
 - Relationships include grade, feedback, and assignment linkage.
 """
 
-from sqlalchemy import Column, Integer, ForeignKey, String, DateTime, func, Text, Boolean
+from sqlalchemy import Column, Integer, ForeignKey, String, DateTime, func, Text, Boolean, Index
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base
@@ -19,6 +19,10 @@ class AssignmentSubmission(Base):
     Supports file and/or text submission, and staff feedback (grade, comments).
     """
     __tablename__ = "assignment_submissions"
+    __table_args__ = (
+        # Serves "submissions for an assignment" and "my submission" lookups
+        Index("ix_assignment_submissions_assignment_id_student_id", "assignment_id", "student_id"),
+    )
 
     submission_id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     assignment_id = Column(Integer, ForeignKey("assignments.assignment_id", ondelete="CASCADE"), nullable=False, index=True)
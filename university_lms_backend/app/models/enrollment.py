@@ -8,7 +8,7 @@ Represents a student's enrollment in a particular course offering.
 - Used for permission, grading, roster, and all student-course logic.
 """
 
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, func, Boolean, String
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, func, Boolean, String, Index
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base
@@ -18,6 +18,10 @@ class Enrollment(Base):
     Database model linking a student (user) to a course offering (for a session).
     """
     __tablename__ = "enrollments"
+    __table_args__ = (
+        # Serves "enrollments for a section group", ordered by creation
+        Index("ix_enrollments_section_group_id_created_at", "section_group_id", "created_at"),
+    )
 
     enrollment_id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     student_id = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False, index=True)
@@ -7,7 +7,7 @@ Represents a grade/score record for a student's work (assignment, quiz, course,
 - Fully unified for global reporting and staff/student access.
 """
 
-from sqlalchemy import Column, Integer, ForeignKey, String, DateTime, Float, func
+from sqlalchemy import Column, Integer, ForeignKey, String, DateTime, Float, func, Index
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base
@@ -17,6 +17,10 @@ class Grade(Base):
     Database model for grades/marks for students' coursework (assignment, quiz, or course grade).
     """
     __tablename__ = "grades"
+    __table_args__ = (
+        # Serves "grades for a student", ordered by creation
+        Index("ix_grades_student_id_created_at", "student_id", "created_at"),
+    )
 
     grade_id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     student_id = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False, index=True)
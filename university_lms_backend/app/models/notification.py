@@ -8,7 +8,7 @@ Represents a notification sent to a user (system, assignment, feedback, etc.)
 - Unified audit and delivery fields.
 """
 
-from sqlalchemy import Column, Integer, ForeignKey, String, Boolean, DateTime, func, Text
+from sqlalchemy import Column, Integer, ForeignKey, String, Boolean, DateTime, func, Text, Index
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base
@@ -19,6 +19,10 @@ class Notification(Base):
     (assignment, grading, system update, custom message).
     """
     __tablename__ = "notifications"
+    __table_args__ = (
+        # Serves "my notifications, newest first" (scanned backwards for DESC)
+        Index("ix_notifications_user_id_created_at", "user_id", "created_at"),
+    )
 
     notification_id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     user_id = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False, index=True)
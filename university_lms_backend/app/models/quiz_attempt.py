@@ -8,7 +8,7 @@ Represents a single user's attempt to complete a quiz.
 - Used for time tracking, scoring, and anti-cheating enforcement.
 """
 
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, func, Float, Boolean
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, func, Float, Boolean, Index
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base
@@ -19,6 +19,10 @@ class QuizAttempt(Base):
     Records score, timing, and links to each answer row.
     """
     __tablename__ = "quiz_attempts"
+    __table_args__ = (
+        # Serves "attempts for a quiz" and "a student's attempts at a quiz"
+        Index("ix_quiz_attempts_quiz_id_student_id", "quiz_id", "student_id"),
+    )
 
     attempt_id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     quiz_id = Column(Integer, ForeignKey("quizzes.quiz_id", ondelete="CASCADE"), nullable=False, index=True)
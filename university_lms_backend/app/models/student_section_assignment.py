@@ -7,7 +7,7 @@ Maps students to their assigned section groups within a course offering (e.g., f
 - Fully unified with global user, course offering, and section group models.
 """
 
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, func
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, func, Index
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base
@@ -18,6 +18,13 @@ class StudentSectionAssignment(Base):
     E.g., assigning student X to Lab group A for course C.
     """
     __tablename__ = "student_section_assignments"
+    __table_args__ = (
+        # Index-only scan for "students in a section group", in (student_id, assignment_id) keyset order
+        Index(
+            "ix_student_section_assignments_group_student_assignment",
+            "section_group_id", "student_id", "assignment_id",
+        ),
+    )
 
     assignment_id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     student_id = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False, index=True)
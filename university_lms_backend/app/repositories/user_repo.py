@@ -7,8 +7,8 @@ Handles all CRUD, authentication, and query operations on User entities in the L
 - Uses global SQLAlchemy ORM session and model patterns.
 """
 
-from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select, update
 from app.models.user import User
 
 class UserRepository:
@@ -56,6 +56,15 @@ class UserRepository:
         stmt = select(User).where(User.user_id == user_id)
         return db.execute(stmt).scalar_one_or_none()
 
+    @staticmethod
+    def get_with_role(db: Session, user_id: int):
+        """
+        Retrieve a user with their role loaded in the same query, so role checks
+        (is_admin, require_role) need no further round trips.
+        """
+        stmt = select(User).options(joinedload(User.role)).where(User.user_id == user_id)
+        return db.execute(stmt).scalar_one_or_none()
+
     @staticmethod
     def get_by_username(db: Session, username: str):
         """
@@ -108,6 +117,23 @@ class UserRepository:
         db.refresh(user)
         return user
 
+    @staticmethod
+    def update_password(db: Session, user_id: int, password_hash: str) -> bool:
+        """
+        Set a user's password hash in a single UPDATE ... RETURNING round trip.
+        Returns False if no such user exists.
+        """
+        stmt = (
+            update(User)
+            .where(User.user_id == user_id)
+            .values(password_hash=password_hash)
+            .returning(User.user_id)
+            .execution_options(synchronize_session=False)
+        )
+        updated = db.execute(stmt).scalar_one_or_none()
+        db.commit()
+        return updated is not None
+
     @staticmethod
     def delete(db: Session, user_id: int):
         """
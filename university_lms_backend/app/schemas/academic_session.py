@@ -43,8 +43,7 @@ class AcademicSessionInDBBase(AcademicSessionBase):
     """
     session_id: int
 
-    class Config:
-        orm_mode = True
+    model_config = {"from_attributes": True}
 
 class AcademicSession(AcademicSessionInDBBase):
     """
@@ -39,8 +39,7 @@ class AdminInDBBase(AdminBase):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    class Config:
-        orm_mode = True
+    model_config = {"from_attributes": True}
 
 class Admin(AdminInDBBase):
     """
@@ -11,6 +11,8 @@ from pydantic import BaseModel, Field
 from typing import Optional
 from datetime import datetime
 
+from app.schemas.assignment_submission import MySubmissionSummary
+
 class AssignmentBase(BaseModel):
     """
     Shared base schema for assignments (creation/update/read).
@@ -47,8 +49,7 @@ class AssignmentInDBBase(AssignmentBase):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    class Config:
-        orm_mode = True
+    model_config = {"from_attributes": True}
 
 class Assignment(AssignmentInDBBase):
     """
@@ -62,6 +63,13 @@ class AssignmentResponse(AssignmentInDBBase):
     """
     pass
 
+class AssignmentWithMySubmissionResponse(BaseModel):
+    """
+    An assignment together with the requesting student's submission, if any.
+    """
+    assignment: AssignmentResponse
+    my_submission: Optional[MySubmissionSummary] = None
+
 class AssignmentInDB(AssignmentInDBBase):
     """
     Schema for returning assignment records from DB.
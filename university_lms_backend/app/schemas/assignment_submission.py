@@ -49,8 +49,7 @@ class AssignmentSubmissionInDBBase(AssignmentSubmissionBase):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    class Config:
-        orm_mode = True
+    model_config = {"from_attributes": True}
 
 class AssignmentSubmission(AssignmentSubmissionInDBBase):
     """
@@ -64,6 +63,21 @@ class AssignmentSubmissionResponse(AssignmentSubmissionInDBBase):
     """
     pass
 
+class MySubmissionSummary(BaseModel):
+    """
+    The requesting student's submission as stored, nested in assignment listings.
+    """
+    submission_id: int = Field(..., description="Primary key for the assignment submission")
+    file_name: Optional[str] = Field(None, description="Original filename uploaded")
+    file_path: Optional[str] = Field(None, description="Path to the submitted file, if a file was uploaded")
+    content_type: Optional[str] = Field(None, description="MIME type of the submitted file")
+    grade: Optional[str] = Field(None, description="Grade for the submission (letter or percent)")
+    feedback: Optional[str] = Field(None, description="Feedback/comments from the instructor")
+    created_at: datetime = Field(..., description="Timestamp of submission")
+    updated_at: Optional[datetime] = None
+
+    model_config = {"from_attributes": True}
+
 class AssignmentSubmissionFeedbackRequest(BaseModel):
     """
     Request schema for providing feedback on assignment submissions.
@@ -47,8 +47,7 @@ class CourseCatalogInDBBase(CourseCatalogBase):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    class Config:
-        orm_mode = True
+    model_config = {"from_attributes": True}
 
 class CourseCatalog(CourseCatalogInDBBase):
     """
@@ -47,8 +47,7 @@ class CourseOfferingInDBBase(CourseOfferingBase):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    class Config:
-        orm_mode = True
+    model_config = {"from_attributes": True}
 
 class CourseOffering(CourseOfferingInDBBase):
     """
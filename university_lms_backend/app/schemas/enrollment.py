@@ -42,8 +42,7 @@ class EnrollmentInDBBase(EnrollmentBase):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    class Config:
-        orm_mode = True
+    model_config = {"from_attributes": True}
 
 class Enrollment(EnrollmentInDBBase):
     """
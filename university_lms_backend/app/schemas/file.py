@@ -28,3 +28,4 @@ class FileInfoResponse(BaseModel):
     mime_type: Optional[str] = None
     uploaded_by: Optional[int] = Field(None, description="User ID who uploaded")
     uploaded_at: Optional[datetime] = None
+    download_url: Optional[str] = Field(None, description="Short-lived signed download URL")
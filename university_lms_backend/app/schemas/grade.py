@@ -49,8 +49,7 @@ class GradeInDBBase(GradeBase):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    class Config:
-        orm_mode = True
+    model_config = {"from_attributes": True}
 
 class Grade(GradeInDBBase):
     """
@@ -37,6 +37,20 @@ class NotificationUpdate(BaseModel):
     read: Optional[bool] = None
     url: Optional[str] = None
 
+class NotificationBroadcast(BaseModel):
+    """
+    Schema for sending one notification to every active user, optionally limited to a role.
+    """
+    message: str = Field(..., description="Content of the notification message")
+    type: str = Field("system", description="Type/category of notification")
+    role_id: Optional[int] = Field(None, description="Only notify users with this role (all users if omitted)")
+
+class NotificationBroadcastResponse(BaseModel):
+    """
+    Result of a broadcast: how many notifications were created.
+    """
+    sent: int = Field(..., description="Number of recipients notified")
+
 class NotificationInDBBase(NotificationBase):
     """
     DB/response fields for notifications.
@@ -45,8 +59,7 @@ class NotificationInDBBase(NotificationBase):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    class Config:
-        orm_mode = True
+    model_config = {"from_attributes": True}
 
 class Notification(NotificationInDBBase):
     """
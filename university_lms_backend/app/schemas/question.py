@@ -45,8 +45,7 @@ class QuestionInDBBase(QuestionBase):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    class Config:
-        orm_mode = True
+    model_config = {"from_attributes": True}
 
 class Question(QuestionInDBBase):
     """
@@ -51,8 +51,7 @@ class QuizAnswerInDBBase(QuizAnswerBase):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    class Config:
-        orm_mode = True
+    model_config = {"from_attributes": True}
 
 class QuizAnswer(QuizAnswerInDBBase):
     """
@@ -41,8 +41,7 @@ class RoleInDBBase(RoleBase):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    class Config:
-        orm_mode = True
+    model_config = {"from_attributes": True}
 
 class Role(RoleInDBBase):
     """
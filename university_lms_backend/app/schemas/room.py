@@ -45,8 +45,7 @@ class RoomInDBBase(RoomBase):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    class Config:
-        orm_mode = True
+    model_config = {"from_attributes": True}
 
 class Room(RoomInDBBase):
     """
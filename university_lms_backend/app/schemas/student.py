@@ -43,8 +43,7 @@ class StudentInDBBase(StudentBase):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    class Config:
-        orm_mode = True
+    model_config = {"from_attributes": True}
 
 class Student(StudentInDBBase):
     """
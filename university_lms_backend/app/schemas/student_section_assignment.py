@@ -41,8 +41,7 @@ class StudentSectionAssignmentInDBBase(StudentSectionAssignmentBase):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    class Config:
-        orm_mode = True
+    model_config = {"from_attributes": True}
 
 class StudentSectionAssignment(StudentSectionAssignmentInDBBase):
     """
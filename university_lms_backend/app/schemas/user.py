@@ -137,6 +137,8 @@ class UserInDBBase(UserBase):
                 # Create a new dict with all attributes
                 new_values = dict(values_dict)
                 new_values['status'] = 'active' if is_active else 'inactive'
+                # full_name is a hybrid property, so it is not in the instance __dict__
+                new_values.setdefault('full_name', values.full_name)
                 return new_values
         # If values is already a dict, check for is_active
         elif isinstance(values, dict):
@@ -9,8 +9,11 @@ and business logic for files attached to assignments in the LMS.
 """
 
 from sqlalchemy.orm import Session
+from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
 from typing import Optional, List
 
+from app.core.storage import save_upload_file
 from app.models.assignment_file import AssignmentFile
 from app.schemas.assignment_file import (
     AssignmentFileCreate,
@@ -58,6 +61,38 @@ class AssignmentFileService:
         db.refresh(file_obj)
         return AssignmentFileSchema.from_orm(file_obj)
 
+    @staticmethod
+    def _save_upload_record(db: Session, file_obj: AssignmentFile) -> None:
+        """
+        Blocking part of an assignment file upload: insert the row and reload its defaults.
+        Runs in the threadpool so the commit does not stall the event loop.
+        """
+        db.add(file_obj)
+        db.commit()
+        db.refresh(file_obj)
+
+    @staticmethod
+    async def create_assignment_file(
+        db: Session,
+        assignment_id: int,
+        file: UploadFile,
+        user,
+    ) -> AssignmentFile:
+        """
+        Stream an uploaded file to storage and record it against the assignment.
+        The upload is copied in chunks; its contents are never read into memory at once.
+        """
+        stored = await save_upload_file(file, subdir="assignments")
+        file_obj = AssignmentFile(
+            assignment_id=assignment_id,
+            filename=file.filename,
+            content_type=file.content_type or "application/octet-stream",
+            file_path=stored.path,
+            uploaded_by_id=user.user_id,
+        )
+        await run_in_threadpool(AssignmentFileService._save_upload_record, db, file_obj)
+        return file_obj
+
     @staticmethod
     def update(
         db: Session, 
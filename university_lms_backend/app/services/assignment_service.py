@@ -8,10 +8,13 @@ for assignments within the LMS.
 - Utilizes global models, schemas, and unification best practices for maintainability.
 """
 
+from sqlalchemy import and_
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 from app.models.assignment import Assignment
+from app.models.assignment_submission import AssignmentSubmission
+from app.models.section_group import SectionGroup
 from app.schemas.assignment import (
     AssignmentCreate,
     AssignmentUpdate,
@@ -86,4 +89,30 @@ class AssignmentService:
             return False
         db.delete(assignment_obj)
         db.commit()
-        return True
\ No newline at end of file
+        return True
+
+    @staticmethod
+    def list_with_submissions_for_student(
+        db: Session,
+        section_group_id: int,
+        student_id: int,
+    ) -> List[Tuple[Assignment, Optional[AssignmentSubmission]]]:
+        """
+        List a section group's assignments paired with the student's final submission (or None).
+        Issues a single LEFT OUTER JOIN instead of one submission lookup per assignment.
+        """
+        return (
+            db.query(Assignment, AssignmentSubmission)
+            .join(SectionGroup, SectionGroup.course_offering_id == Assignment.course_offering_id)
+            .outerjoin(
+                AssignmentSubmission,
+                and_(
+                    AssignmentSubmission.assignment_id == Assignment.assignment_id,
+                    AssignmentSubmission.student_id == student_id,
+                    AssignmentSubmission.is_final.is_(True),
+                ),
+            )
+            .filter(SectionGroup.section_group_id == section_group_id)
+            .order_by(Assignment.due_date, Assignment.assignment_id)
+            .all()
+        )
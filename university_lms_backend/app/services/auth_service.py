@@ -9,6 +9,7 @@ and password reset functionality.
 """
 
 from fastapi import HTTPException, status, BackgroundTasks, Depends
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from typing import Optional
@@ -25,7 +26,12 @@ from app.schemas.auth import (
 )
 from app.schemas.user import UserCreate
 from app.core.config import settings
-from app.core.security import verify_password, get_password_hash, create_access_token
+from app.core.security import (
+    create_access_token,
+    get_password_hash,
+    run_password_hashing,
+    verify_password,
+)
 from app.core.database import get_db
 from app.repositories.user_repo import UserRepository
 from app.repositories.role_repo import RoleRepository
@@ -36,13 +42,37 @@ class AuthService:
     Handles authentication and authorization business logic.
     """
 
+    @staticmethod
+    def _record_login(db: Session, user_id: int) -> UserInfo:
+        """
+        Blocking part of a successful login: last-login update and role lookup.
+        Runs in the threadpool so it does not stall the event loop.
+        """
+        # Update last login timestamp
+        user = UserRepository.update(db, user_id, last_login=datetime.utcnow())
+        
+        # Get role name if available
+        role_name = None
+        if user.role:
+            role_name = user.role.name if hasattr(user.role, 'name') else str(user.role)
+        
+        return UserInfo(
+            user_id=user.user_id,
+            username=user.username,
+            email=user.email,
+            full_name=user.full_name,
+            role=role_name,
+            is_active=user.is_active
+        )
+
     @staticmethod
     async def login(form_data: OAuth2PasswordRequestForm, db: Session) -> AuthTokenResponse:
         """
         Authenticate user with username and password, return JWT tokens.
+        DB work runs in the threadpool; the password hash check runs on the password pool.
         """
         # Look up user by username
-        user = UserRepository.get_by_username(db, form_data.username)
+        user = await run_in_threadpool(UserRepository.get_by_username, db, form_data.username)
         
         if not user:
             raise HTTPException(
@@ -52,7 +82,7 @@ class AuthService:
             )
         
         # Verify password
-        if not verify_password(form_data.password, user.password_hash):
+        if not await run_password_hashing(verify_password, form_data.password, user.password_hash):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect username or password",
@@ -66,38 +96,22 @@ class AuthService:
                 detail="User account is inactive",
             )
         
-        # Update last login timestamp
-        UserRepository.update(db, user.user_id, last_login=datetime.utcnow())
+        user_info = await run_in_threadpool(AuthService._record_login, db, user.user_id)
         
         # Create access token
         access_token_expires = timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRES_MINUTES)
         access_token = create_access_token(
-            data={"sub": str(user.user_id)},
+            data={"sub": str(user_info.user_id)},
             expires_delta=access_token_expires
         )
         
         # Create refresh token
         refresh_token_expires = timedelta(minutes=settings.JWT_REFRESH_TOKEN_EXPIRES_MINUTES)
         refresh_token = create_access_token(
-            data={"sub": str(user.user_id), "type": "refresh"},
+            data={"sub": str(user_info.user_id), "type": "refresh"},
             expires_delta=refresh_token_expires
         )
         
-        # Get role name if available
-        role_name = None
-        if user.role:
-            role_name = user.role.name if hasattr(user.role, 'name') else str(user.role)
-        
-        # Create user info
-        user_info = UserInfo(
-            user_id=user.user_id,
-            username=user.username,
-            email=user.email,
-            full_name=user.full_name,
-            role=role_name,
-            is_active=user.is_active
-        )
-        
         return AuthTokenResponse(
             access_token=access_token,
             refresh_token=refresh_token,
@@ -213,24 +227,27 @@ class AuthService:
     async def change_password(user, change_request: AuthPasswordChangeRequest, db: Session):
         """
         Change password for authenticated user.
+        DB work runs in the threadpool; both hash computations run on the password pool.
         """
         # Verify old password
-        user_obj = UserRepository.get_by_id(db, user.user_id)
+        user_obj = await run_in_threadpool(UserRepository.get_by_id, db, user.user_id)
         if not user_obj:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
         
-        if not verify_password(change_request.old_password, user_obj.password_hash):
+        if not await run_password_hashing(
+            verify_password, change_request.old_password, user_obj.password_hash
+        ):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Incorrect old password"
             )
         
         # Hash and update new password
-        new_password_hash = get_password_hash(change_request.new_password)
-        UserRepository.update(db, user.user_id, password_hash=new_password_hash)
+        new_password_hash = await run_password_hashing(get_password_hash, change_request.new_password)
+        await run_in_threadpool(UserRepository.update, db, user.user_id, password_hash=new_password_hash)
         
         return {"message": "Password changed successfully"}
 
@@ -4,9 +4,18 @@ Course Service (Production)
 Service layer for managing Course Catalog entities.
 """
 
-from sqlalchemy.orm import Session
+from sqlalchemy import or_
+from sqlalchemy.orm import Session, selectinload
 from typing import Optional, List
 
+from app.core.database import SessionLocal
+
+from app.models.associate_teacher import AssociateTeacher
+from app.models.course_catalog import CourseCatalog
+from app.models.course_offering import CourseOffering
+from app.models.enrollment import Enrollment
+from app.models.professor import Professor
+
 
 class CourseService:
     """
@@ -20,10 +29,61 @@ class CourseService:
         return []
 
     @staticmethod
-    def get_by_id(db: Session, course_id: int):
-        """Retrieve a course by ID"""
-        # TODO: Implement actual database query
-        return None
+    def list_catalog_courses(db: Session, search: str = "") -> List[dict]:
+        """
+        List catalog courses ordered by course code, optionally matching `search`
+        against the code or name, as response payloads.
+        """
+        query = db.query(CourseCatalog)
+        if search:
+            pattern = f"%{search}%"
+            query = query.filter(or_(
+                CourseCatalog.course_code.ilike(pattern),
+                CourseCatalog.course_name.ilike(pattern),
+            ))
+        return [
+            {
+                "course_id": course.course_id,
+                "course_code": course.course_code,
+                "course_name": course.course_name,
+                "credits": course.credits,
+                "created_at": course.created_at,
+                "updated_at": course.updated_at,
+            }
+            for course in query.order_by(CourseCatalog.course_code).all()
+        ]
+
+    @staticmethod
+    def load_catalog_courses(search: str = "") -> List[dict]:
+        """
+        list_catalog_courses with a short-lived session of its own, so a background
+        cache refresh can run it after the request's session is closed.
+        """
+        db = SessionLocal()
+        try:
+            return CourseService.list_catalog_courses(db, search)
+        finally:
+            db.close()
+
+    @staticmethod
+    def get_by_id(db: Session, course_id: int) -> Optional[CourseCatalog]:
+        """
+        Retrieve a course by ID with its offerings, sections, staff, and enrollments.
+        Each relationship level is batch-loaded with one SELECT ... WHERE IN query,
+        so the query count does not grow with the number of offerings or sections.
+        """
+        offerings = selectinload(CourseCatalog.offerings)
+        return (
+            db.query(CourseCatalog)
+            .options(
+                offerings.selectinload(CourseOffering.section_groups),
+                offerings.selectinload(CourseOffering.professors).selectinload(Professor.user),
+                offerings.selectinload(CourseOffering.associate_teachers).selectinload(AssociateTeacher.user),
+                offerings.selectinload(CourseOffering.enrollments).selectinload(Enrollment.student),
+            )
+            .filter(CourseCatalog.course_id == course_id)
+            .first()
+        )
 
     @staticmethod
     def create(db: Session, course_data):
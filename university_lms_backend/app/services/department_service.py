@@ -6,6 +6,7 @@ business policies for departments within the LMS.
 
 - No sample, demo, or test code.
 - Utilizes global models, schemas, and project-wide unification conventions.
+- Keeps a per-process copy of all departments (they rarely change) for code lookups.
 """
 
 from sqlalchemy.orm import Session
@@ -17,6 +18,11 @@ from app.schemas.department import (
     DepartmentUpdate,
 )
 from app.schemas.department import Department as DepartmentSchema
+from app.core.database import SessionLocal
+
+# Per-process cache: department code -> response payload. None until first loaded;
+# once loaded it holds every department, so a miss means "no such department".
+_departments_by_code: Optional[dict] = None
 
 class DepartmentService:
     """
@@ -31,6 +37,68 @@ class DepartmentService:
         dept_obj = db.query(Department).filter(Department.department_id == department_id).first()
         return DepartmentSchema.from_orm(dept_obj) if dept_obj else None
 
+    @staticmethod
+    def _to_payload(dept: Department) -> dict:
+        return {
+            "department_id": dept.dept_id,
+            "name": dept.name,
+            "code": dept.code,
+            "created_at": dept.created_at,
+            "updated_at": dept.updated_at,
+        }
+
+    @staticmethod
+    def warm_cache(db: Session) -> int:
+        """
+        Load every department into the per-process cache, replacing it atomically.
+        Returns the number of departments cached.
+        """
+        global _departments_by_code
+        _departments_by_code = {
+            d.code: DepartmentService._to_payload(d) for d in db.query(Department).all()
+        }
+        return len(_departments_by_code)
+
+    @staticmethod
+    def reload_cache() -> int:
+        """
+        Rebuild the per-process cache with a short-lived session of its own.
+        """
+        db = SessionLocal()
+        try:
+            return DepartmentService.warm_cache(db)
+        finally:
+            db.close()
+
+    @staticmethod
+    def get_cached_by_code(code: str) -> tuple[bool, Optional[dict]]:
+        """
+        Look a department up in the per-process cache without touching the database.
+        Returns (cache_loaded, payload); payload is None when the code does not exist.
+        """
+        cache = _departments_by_code
+        if cache is None:
+            return False, None
+        return True, cache.get(code)
+
+    @staticmethod
+    def list_departments() -> List[dict]:
+        """
+        Every department as a response payload, ordered by name. Served from the
+        per-process cache, which is loaded with its own session if it is not yet.
+        """
+        if _departments_by_code is None:
+            DepartmentService.reload_cache()
+        return sorted(_departments_by_code.values(), key=lambda d: d["name"])
+
+    @staticmethod
+    def get_by_code(db: Session, code: str) -> Optional[dict]:
+        """
+        Retrieve a department by its code from the database.
+        """
+        dept_obj = db.query(Department).filter(Department.code == code).first()
+        return DepartmentService._to_payload(dept_obj) if dept_obj else None
+
     @staticmethod
     def get_all(db: Session, skip: int = 0, limit: int = 100) -> List[DepartmentSchema]:
         """
@@ -8,9 +8,11 @@ and business logic for student enrollments in course offerings.
 - Utilizes global models, schemas, and unified best practices.
 """
 
+from sqlalchemy import Boolean, bindparam, or_, select
 from sqlalchemy.orm import Session
 from typing import Optional, List
 
+from app.core.permissions import is_offering_staff
 from app.models.enrollment import Enrollment
 from app.schemas.enrollment import (
     EnrollmentCreate,
@@ -18,6 +20,28 @@ from app.schemas.enrollment import (
 )
 from app.schemas.enrollment import Enrollment as EnrollmentSchema
 
+# Column-only statement built once; SQLAlchemy caches its compiled form across calls.
+# Rows come back as plain mappings, skipping ORM identity-map and instrumentation work.
+_ENROLLMENTS_BY_SECTION_GROUP = (
+    select(
+        Enrollment.enrollment_id,
+        Enrollment.student_id,
+        Enrollment.course_offering_id,
+        Enrollment.status,
+        Enrollment.created_at,
+        Enrollment.updated_at,
+    )
+    .where(
+        Enrollment.section_group_id == bindparam("section_group_id"),
+        # Access check in SQL: admins, or staff of the enrollment's course offering
+        or_(
+            bindparam("viewer_is_admin", type_=Boolean),
+            is_offering_staff(Enrollment.course_offering_id, bindparam("viewer_id")),
+        ),
+    )
+    .order_by(Enrollment.enrollment_id)
+)
+
 class EnrollmentService:
     """
     Handles CRUD and business operations for student enrollments.
@@ -47,6 +71,21 @@ class EnrollmentService:
         enrollments = db.query(Enrollment).filter(Enrollment.course_offering_id == course_offering_id).all()
         return [EnrollmentSchema.from_orm(e) for e in enrollments]
 
+    @staticmethod
+    def get_by_section_group_id(db: Session, section_group_id: int, viewer) -> list:
+        """
+        List the enrollments of a section group that `viewer` may see, as flat row
+        mappings (read-only). Non-staff viewers get an empty list.
+        """
+        return db.execute(
+            _ENROLLMENTS_BY_SECTION_GROUP,
+            {
+                "section_group_id": section_group_id,
+                "viewer_id": viewer.user_id,
+                "viewer_is_admin": bool(viewer.is_admin),
+            },
+        ).mappings().all()
+
     @staticmethod
     def get_all(db: Session, skip: int = 0, limit: int = 100) -> List[EnrollmentSchema]:
         """
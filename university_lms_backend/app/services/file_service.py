@@ -6,8 +6,12 @@ Service layer for file upload and management.
 
 from sqlalchemy.orm import Session
 from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
 from typing import Optional, List
 
+from app.core.storage import save_upload_file
+from app.models.uploaded_file import UploadedFile
+
 
 class FileService:
     """
@@ -15,16 +19,41 @@ class FileService:
     """
 
     @staticmethod
-    async def upload_file(db: Session, file: UploadFile, user_id: int):
-        """Upload and store a file"""
-        # TODO: Implement actual file upload logic
-        raise NotImplementedError("File upload not yet implemented")
+    def _save_upload_record(db: Session, file_obj: UploadedFile) -> None:
+        """
+        Commit the uploaded file's row off the event loop and refresh uploaded_at.
+        """
+        db.add(file_obj)
+        db.commit()
+        db.refresh(file_obj)
+
+    @staticmethod
+    async def upload_file(db: Session, file: UploadFile, user_id: int) -> dict:
+        """
+        Stream an uploaded file to storage and record it for the user.
+        The upload is copied and hashed in 1 MiB chunks, never read into memory whole.
+        """
+        stored = await save_upload_file(file, subdir="files")
+        file_obj = UploadedFile(
+            user_id=user_id,
+            filename=file.filename,
+            file_path=stored.path,
+            file_type=file.content_type,
+        )
+        await run_in_threadpool(FileService._save_upload_record, db, file_obj)
+        return {
+            "file_id": file_obj.file_id,
+            "filename": file_obj.filename,
+            "file_path": file_obj.file_path,
+            "file_size": stored.size,
+            "mime_type": file_obj.file_type,
+            "uploaded_at": file_obj.uploaded_at,
+        }
 
     @staticmethod
-    def get_by_id(db: Session, file_id: int):
+    def get_by_id(db: Session, file_id: int) -> Optional[UploadedFile]:
         """Retrieve file information by ID"""
-        # TODO: Implement actual database query
-        return None
+        return db.query(UploadedFile).filter(UploadedFile.file_id == file_id).first()
 
     @staticmethod
     def get_all(db: Session, user_id: Optional[int] = None, skip: int = 0, limit: int = 100):
@@ -7,16 +7,45 @@ Service layer for managing Grade entities, encapsulating CRUD operations and bus
 - Utilizes global models, schemas, and system-wide conventions.
 """
 
+from sqlalchemy import Boolean, bindparam, insert, or_, select, union
 from sqlalchemy.orm import Session
 from typing import Optional, List
 
+from app.core.permissions import is_offering_staff
+from app.models.associate_teacher import AssociateTeacher
 from app.models.grade import Grade
+from app.models.professor import Professor
 from app.schemas.grade import (
     GradeCreate,
     GradeUpdate,
 )
 from app.schemas.grade import Grade as GradeSchema
 
+# Column-only statement built once; the access rule is part of the WHERE clause,
+# so rows the viewer may not see are never fetched.
+_GRADES_FOR_STUDENT = (
+    select(
+        Grade.grade_id,
+        Grade.student_id,
+        Grade.course_offering_id,
+        Grade.assignment_id,
+        Grade.quiz_id,
+        Grade.numeric_score.label("value"),
+        Grade.remarks,
+        Grade.created_at,
+        Grade.updated_at,
+    )
+    .where(
+        Grade.student_id == bindparam("student_id"),
+        or_(
+            bindparam("viewer_is_admin", type_=Boolean),
+            Grade.student_id == bindparam("viewer_id"),
+            is_offering_staff(Grade.course_offering_id, bindparam("viewer_id")),
+        ),
+    )
+    .order_by(Grade.created_at, Grade.grade_id)
+)
+
 class GradeService:
     """
     Handles CRUD and business operations for grade records.
@@ -46,6 +75,21 @@ class GradeService:
         grades = db.query(Grade).filter(Grade.assignment_id == assignment_id).all()
         return [GradeSchema.from_orm(g) for g in grades]
 
+    @staticmethod
+    def get_visible_for_student(db: Session, student_id: int, viewer) -> list:
+        """
+        List a student's grades that `viewer` may see, as flat row mappings (read-only):
+        all of them for admins and the student, only their offerings' grades for staff.
+        """
+        return db.execute(
+            _GRADES_FOR_STUDENT,
+            {
+                "student_id": student_id,
+                "viewer_id": viewer.user_id,
+                "viewer_is_admin": bool(viewer.is_admin),
+            },
+        ).mappings().all()
+
     @staticmethod
     def get_all(db: Session, skip: int = 0, limit: int = 100) -> List[GradeSchema]:
         """
@@ -65,6 +109,60 @@ class GradeService:
         db.refresh(grade_obj)
         return GradeSchema.from_orm(grade_obj)
 
+    @staticmethod
+    def can_grade_offerings(db: Session, user, offering_ids: set) -> bool:
+        """
+        True if `user` is an admin, or a professor/associate teacher of every offering
+        in `offering_ids`. One query covers the whole set.
+        """
+        if user.is_admin:
+            return True
+        staffed = union(
+            select(Professor.course_offering_id).where(
+                Professor.user_id == user.user_id,
+                Professor.course_offering_id.in_(offering_ids),
+            ),
+            select(AssociateTeacher.course_offering_id).where(
+                AssociateTeacher.user_id == user.user_id,
+                AssociateTeacher.course_offering_id.in_(offering_ids),
+            ),
+        )
+        return set(db.scalars(staffed).all()) == set(offering_ids)
+
+    @staticmethod
+    def bulk_create(db: Session, grades_in: List[GradeCreate]) -> list:
+        """
+        Insert many grade records in one executemany round-trip and return the new rows.
+        """
+        rows = [
+            {
+                "student_id": g.student_id,
+                "course_offering_id": g.course_offering_id,
+                "assignment_id": g.assignment_id,
+                "quiz_id": g.quiz_id,
+                "grade_value": f"{g.value:g}",
+                "numeric_score": g.value,
+                "remarks": g.remarks,
+            }
+            for g in grades_in
+        ]
+        created = db.execute(
+            insert(Grade).returning(
+                Grade.grade_id,
+                Grade.student_id,
+                Grade.course_offering_id,
+                Grade.assignment_id,
+                Grade.quiz_id,
+                Grade.numeric_score.label("value"),
+                Grade.remarks,
+                Grade.created_at,
+                Grade.updated_at,
+            ),
+            rows,
+        ).mappings().all()
+        db.commit()
+        return created
+
     @staticmethod
     def update(
         db: Session,
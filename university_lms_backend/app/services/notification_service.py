@@ -8,10 +8,12 @@ and business logic for notifications within the LMS.
 - Utilizes global models, schemas, and system-wide conventions.
 """
 
+from sqlalchemy import false, insert, literal, select
 from sqlalchemy.orm import Session
 from typing import Optional, List
 
 from app.models.notification import Notification
+from app.models.user import User
 from app.schemas.notification import (
     NotificationCreate,
     NotificationUpdate,
@@ -58,6 +60,36 @@ class NotificationService:
         db.refresh(notif_obj)
         return NotificationSchema.from_orm(notif_obj)
 
+    @staticmethod
+    def broadcast(
+        db: Session,
+        message: str,
+        notification_type: str,
+        role_id: Optional[int] = None,
+    ) -> int:
+        """
+        Notify every active user (optionally only those with `role_id`) with one
+        INSERT ... SELECT statement, instead of one INSERT per recipient.
+        Returns the number of notifications created.
+        """
+        recipients = select(
+            User.user_id,
+            literal(message),
+            literal(notification_type),
+            false(),
+        ).where(User.is_active.is_(True))
+        if role_id is not None:
+            recipients = recipients.where(User.role_id == role_id)
+
+        result = db.execute(
+            insert(Notification).from_select(
+                ["user_id", "message", "notification_type", "is_read"],
+                recipients,
+            )
+        )
+        db.commit()
+        return result.rowcount
+
     @staticmethod
     def update(
         db: Session,
@@ -4,9 +4,25 @@ Course Offering Service (Production)
 Service layer for managing Course Offering entities.
 """
 
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 from typing import Optional, List
 
+from app.models.course_offering import CourseOffering
+
+# Column-only statement built once; SQLAlchemy caches its compiled form across calls.
+# Rows come back as plain mappings, skipping ORM identity-map and instrumentation work.
+_OFFERINGS_BY_SESSION = (
+    select(
+        CourseOffering.offering_id,
+        CourseOffering.course_id,
+        CourseOffering.academic_session_id.label("session_id"),
+        CourseOffering.created_at,
+        CourseOffering.updated_at,
+    )
+    .where(CourseOffering.academic_session_id == bindparam("session_id"))
+    .order_by(CourseOffering.offering_id)
+)
 
 class CourseOfferingService:
     """
@@ -25,6 +41,13 @@ class CourseOfferingService:
         # TODO: Implement actual database query
         return None
 
+    @staticmethod
+    def get_by_session_id(db: Session, session_id: int) -> list:
+        """
+        List the offerings of an academic session as flat row mappings (read-only).
+        """
+        return db.execute(_OFFERINGS_BY_SESSION, {"session_id": session_id}).mappings().all()
+
     @staticmethod
     def create(db: Session, offering_data):
         """Create a new course offering"""
@@ -8,9 +8,16 @@ CRUD operations and business logic for quiz attempts in the LMS.
 - Utilizes global models, schemas, and system conventions.
 """
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Boolean, and_, bindparam, case, exists, func, or_, select, update
+from sqlalchemy.orm import Session, aliased
 from typing import Optional, List
 
+from app.core.permissions import cached_decision, is_offering_staff
+from app.core.responses import DEFAULT_PAGE_SIZE
+from app.models.question import Question
+from app.models.question_option import QuestionOption
+from app.models.quiz import Quiz
+from app.models.quiz_answer import QuizAnswer
 from app.models.quiz_attempt import QuizAttempt
 from app.schemas.quiz_attempt import (
     QuizAttemptCreate,
@@ -18,6 +25,128 @@ from app.schemas.quiz_attempt import (
 )
 from app.schemas.quiz_attempt import QuizAttempt as QuizAttemptSchema
 
+# Attempt columns under their schema names
+_ATTEMPT_COLUMNS = select(
+    QuizAttempt.attempt_id,
+    QuizAttempt.quiz_id,
+    QuizAttempt.student_id,
+    QuizAttempt.started_at.label("start_time"),
+    QuizAttempt.submitted_at.label("end_time"),
+    QuizAttempt.total_score.label("score"),
+    case(
+        (QuizAttempt.is_graded, "graded"),
+        (QuizAttempt.is_submitted, "completed"),
+        else_="in_progress",
+    ).label("status"),
+)
+
+# Attempts on a quiz, visible to admins and staff of the quiz's offering
+_ATTEMPTS_FOR_QUIZ = (
+    _ATTEMPT_COLUMNS
+    .join(Quiz, Quiz.quiz_id == QuizAttempt.quiz_id)
+    .where(
+        QuizAttempt.quiz_id == bindparam("quiz_id"),
+        QuizAttempt.attempt_id > bindparam("after"),
+        or_(
+            bindparam("viewer_is_admin", type_=Boolean),
+            is_offering_staff(Quiz.course_offering_id, bindparam("viewer_id")),
+        ),
+    )
+    .order_by(QuizAttempt.attempt_id)
+    .limit(bindparam("limit"))
+)
+
+# Closes an open attempt; matches no row if it is not the student's or already submitted
+_CLOSE_ATTEMPT = (
+    update(QuizAttempt)
+    .where(
+        QuizAttempt.attempt_id == bindparam("target_attempt_id"),
+        QuizAttempt.student_id == bindparam("target_student_id"),
+        QuizAttempt.is_submitted.is_(False),
+    )
+    .values(is_submitted=True, submitted_at=func.now())
+    .execution_options(synchronize_session=False)
+)
+
+# Points of the question an answer belongs to
+_QUESTION_POINTS = (
+    select(Question.points)
+    .where(Question.question_id == QuizAnswer.question_id)
+    .scalar_subquery()
+)
+
+# Whether an answer's chosen option is a correct option of that same question
+_SELECTED_OPTION_IS_CORRECT = (
+    select(QuestionOption.is_correct)
+    .where(
+        QuestionOption.option_id == QuizAnswer.selected_option_id,
+        QuestionOption.question_id == QuizAnswer.question_id,
+    )
+    .scalar_subquery()
+)
+
+# The other option-based answers of the same attempt and question (multi-select, duplicates)
+_SIBLING = aliased(QuizAnswer)
+_SIBLING_OF_ANSWER = and_(
+    _SIBLING.attempt_id == QuizAnswer.attempt_id,
+    _SIBLING.question_id == QuizAnswer.question_id,
+    _SIBLING.selected_option_id.is_not(None),
+)
+
+# A question scores once per attempt: only its first option-based answer carries the points
+_IS_FIRST_ANSWER_TO_QUESTION = QuizAnswer.answer_id == (
+    select(func.min(_SIBLING.answer_id)).where(_SIBLING_OF_ANSWER).scalar_subquery()
+)
+
+# The attempt selected exactly the question's correct options: none of its picks is wrong
+# (or belongs to another question), and it picked as many distinct options as are correct
+_QUESTION_ANSWERED_EXACTLY = and_(
+    ~exists().where(
+        _SIBLING_OF_ANSWER,
+        ~exists().where(
+            QuestionOption.option_id == _SIBLING.selected_option_id,
+            QuestionOption.question_id == _SIBLING.question_id,
+            QuestionOption.is_correct.is_(True),
+        ),
+    ),
+    select(func.count(_SIBLING.selected_option_id.distinct())).where(_SIBLING_OF_ANSWER).scalar_subquery()
+    == select(func.count())
+    .where(
+        QuestionOption.question_id == QuizAnswer.question_id,
+        QuestionOption.is_correct.is_(True),
+    )
+    .scalar_subquery(),
+)
+
+# Marks every option-based answer of an attempt in one statement, however many there are
+_GRADE_SELECTED_OPTIONS = (
+    update(QuizAnswer)
+    .where(
+        QuizAnswer.attempt_id == bindparam("target_attempt_id"),
+        QuizAnswer.selected_option_id.is_not(None),
+    )
+    .values(
+        is_correct=func.coalesce(_SELECTED_OPTION_IS_CORRECT, False),
+        score_awarded=case(
+            (and_(_IS_FIRST_ANSWER_TO_QUESTION, _QUESTION_ANSWERED_EXACTLY), _QUESTION_POINTS),
+            else_=0,
+        ),
+    )
+    .execution_options(synchronize_session=False)
+)
+
+# Totals the awarded scores of an attempt's answers
+_TOTAL_ATTEMPT_SCORE = (
+    update(QuizAttempt)
+    .where(QuizAttempt.attempt_id == bindparam("target_attempt_id"))
+    .values(
+        total_score=select(func.coalesce(func.sum(QuizAnswer.score_awarded), 0))
+        .where(QuizAnswer.attempt_id == QuizAttempt.attempt_id)
+        .scalar_subquery()
+    )
+    .execution_options(synchronize_session=False)
+)
+
 class QuizAttemptService:
     """
     Handles CRUD and business logic for quiz attempt records.
@@ -28,9 +157,47 @@ class QuizAttemptService:
         """
         Retrieve a quiz attempt by its unique identifier.
         """
-        attempt_obj = db.query(QuizAttempt).filter(QuizAttempt.quiz_attempt_id == quiz_attempt_id).first()
+        attempt_obj = db.query(QuizAttempt).filter(QuizAttempt.attempt_id == quiz_attempt_id).first()
         return QuizAttemptSchema.from_orm(attempt_obj) if attempt_obj else None
 
+    @staticmethod
+    def can_view(db: Session, user, quiz_attempt_id: int) -> bool:
+        """
+        True if `user` is an admin, the attempt's student, or staff of the quiz's
+        course offering. Memoized for the rest of the request; False for a missing attempt.
+        """
+        if user.is_admin:
+            return True
+        stmt = (
+            select(or_(
+                QuizAttempt.student_id == user.user_id,
+                is_offering_staff(Quiz.course_offering_id, user.user_id),
+            ))
+            .join(Quiz, Quiz.quiz_id == QuizAttempt.quiz_id)
+            .where(QuizAttempt.attempt_id == quiz_attempt_id)
+        )
+        return cached_decision(user, "quiz_attempt:view", quiz_attempt_id, lambda: bool(db.scalar(stmt)))
+
+    @staticmethod
+    def submit(db: Session, quiz_attempt_id: int, student_id: int) -> Optional[dict]:
+        """
+        Submits a student's open attempt and auto-grades its option-based answers with
+        set-based UPDATEs, so the round trips do not grow with the number of answers.
+        A question earns its points once, when exactly its correct options were selected.
+        Returns the attempt as a row mapping, or None if the student has no open attempt
+        with this ID. Free-text answers keep is_correct/score_awarded for staff grading.
+        """
+        params = {"target_attempt_id": quiz_attempt_id, "target_student_id": student_id}
+        if db.execute(_CLOSE_ATTEMPT, params).rowcount == 0:
+            db.rollback()
+            return None
+        db.execute(_GRADE_SELECTED_OPTIONS, params)
+        db.execute(_TOTAL_ATTEMPT_SCORE, params)
+        db.commit()
+        return db.execute(
+            _ATTEMPT_COLUMNS.where(QuizAttempt.attempt_id == quiz_attempt_id)
+        ).mappings().one()
+
     @staticmethod
     def get_by_quiz_id(db: Session, quiz_id: int) -> List[QuizAttemptSchema]:
         """
@@ -39,6 +206,23 @@ class QuizAttemptService:
         attempts = db.query(QuizAttempt).filter(QuizAttempt.quiz_id == quiz_id).all()
         return [QuizAttemptSchema.from_orm(a) for a in attempts]
 
+    @staticmethod
+    def get_visible_for_quiz(db: Session, quiz_id: int, viewer, after: int = 0, limit: int = DEFAULT_PAGE_SIZE) -> list:
+        """
+        One page of attempts on a quiz that `viewer` may review, as row mappings,
+        ordered by attempt_id and starting after the `after` cursor.
+        """
+        return db.execute(
+            _ATTEMPTS_FOR_QUIZ,
+            {
+                "quiz_id": quiz_id,
+                "viewer_id": viewer.user_id,
+                "viewer_is_admin": bool(viewer.is_admin),
+                "after": after,
+                "limit": limit,
+            },
+        ).mappings().all()
+
     @staticmethod
     def get_by_student_id(db: Session, student_id: int) -> List[QuizAttemptSchema]:
         """
@@ -75,7 +259,7 @@ class QuizAttemptService:
         """
         Update an existing quiz attempt with new values.
         """
-        attempt_obj = db.query(QuizAttempt).filter(QuizAttempt.quiz_attempt_id == quiz_attempt_id).first()
+        attempt_obj = db.query(QuizAttempt).filter(QuizAttempt.attempt_id == quiz_attempt_id).first()
         if not attempt_obj:
             return None
         for field, value in attempt_in.dict(exclude_unset=True).items():
@@ -89,7 +273,7 @@ class QuizAttemptService:
         """
         Delete a quiz attempt by its ID. Returns True if deleted, False if not found.
         """
-        attempt_obj = db.query(QuizAttempt).filter(QuizAttempt.quiz_attempt_id == quiz_attempt_id).first()
+        attempt_obj = db.query(QuizAttempt).filter(QuizAttempt.attempt_id == quiz_attempt_id).first()
         if not attempt_obj:
             return False
         db.delete(attempt_obj)
@@ -8,9 +8,12 @@ CRUD operations and business logic for quiz files within the LMS.
 - Utilizes global models, schemas, and system-wide conventions.
 """
 
+from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from typing import Optional, List
 
+from app.core.storage import save_upload_file
 from app.models.quiz_file import QuizFile
 from app.schemas.quiz_file import (
     QuizFileCreate,
@@ -58,6 +61,40 @@ class QuizFileService:
         db.refresh(file_obj)
         return QuizFileSchema.from_orm(file_obj)
 
+    @staticmethod
+    def _save_upload_record(db: Session, file_obj: QuizFile) -> None:
+        """
+        Insert the quiz file row and reload it; called through run_in_threadpool
+        because Session.commit blocks.
+        """
+        db.add(file_obj)
+        db.commit()
+        db.refresh(file_obj)
+
+    @staticmethod
+    async def upload(db: Session, quiz_id: int, file: UploadFile, user_id: int) -> dict:
+        """
+        Stream an uploaded quiz file to storage and record it against the quiz.
+        The upload is copied in chunks from its spooled file, never read into memory whole.
+        """
+        stored = await save_upload_file(file, subdir="quiz_files")
+        file_obj = QuizFile(
+            quiz_id=quiz_id,
+            filename=file.filename,
+            file_path=stored.path,
+            content_type=file.content_type or "application/octet-stream",
+            uploaded_by_id=user_id,
+        )
+        await run_in_threadpool(QuizFileService._save_upload_record, db, file_obj)
+        return {
+            "quiz_file_id": file_obj.file_id,
+            "quiz_id": file_obj.quiz_id,
+            "file_path": file_obj.file_path,
+            "uploaded_by_id": file_obj.uploaded_by_id,
+            "filename": file_obj.filename,
+            "created_at": file_obj.uploaded_at,
+        }
+
     @staticmethod
     def update(
         db: Session,
@@ -7,9 +7,11 @@ Service layer for managing Quiz entities, providing CRUD operations and business
 - Utilizes global models, schemas, and unified conventions.
 """
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from typing import Optional, List
 
+from app.core.permissions import cached_decision, is_offering_staff
 from app.models.quiz import Quiz
 from app.schemas.quiz import (
     QuizCreate,
@@ -30,6 +32,17 @@ class QuizService:
         quiz_obj = db.query(Quiz).filter(Quiz.quiz_id == quiz_id).first()
         return QuizSchema.from_orm(quiz_obj) if quiz_obj else None
 
+    @staticmethod
+    def can_manage(db: Session, user, quiz_id: int) -> bool:
+        """
+        True if `user` is an admin or staff of the quiz's course offering.
+        Memoized for the rest of the request; False for a missing quiz.
+        """
+        if user.is_admin:
+            return True
+        stmt = select(is_offering_staff(Quiz.course_offering_id, user.user_id)).where(Quiz.quiz_id == quiz_id)
+        return cached_decision(user, "quiz:manage", quiz_id, lambda: bool(db.scalar(stmt)))
+
     @staticmethod
     def get_by_course_offering_id(db: Session, course_offering_id: int) -> List[QuizSchema]:
         """
@@ -8,10 +8,12 @@ for system roles within the LMS.
 - Utilizes global models, schemas, and unified project conventions.
 """
 
+from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 from typing import Optional, List
 
 from app.models.role import Role
+from app.models.user import User
 from app.schemas.role import (
     RoleCreate,
     RoleUpdate,
@@ -23,6 +25,45 @@ class RoleService:
     Handles CRUD and business logic for role records.
     """
 
+    @staticmethod
+    def require_admin(user) -> None:
+        """
+        Raise HTTP 403 unless `user` is an administrator. The user's role is loaded with
+        the user by get_current_user, so this is an in-memory check.
+        """
+        if not user.is_admin:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Administrator role required.",
+            )
+
+    @staticmethod
+    def get_user_role(db: Session, user_id: int) -> Optional[dict]:
+        """
+        Return the role assignment of a user, or None if the user does not exist.
+        """
+        row = (
+            db.query(User.user_id, User.role_id, Role.name.label("role_name"), User.updated_at.label("assigned_at"))
+            .outerjoin(Role, Role.role_id == User.role_id)
+            .filter(User.user_id == user_id)
+            .first()
+        )
+        return dict(row._mapping) if row else None
+
+    @staticmethod
+    def assign_role(db: Session, user_id: int, role_id: int) -> Optional[dict]:
+        """
+        Give a user the role `role_id`.
+        Returns None if the user or role does not exist.
+        """
+        if db.query(Role.role_id).filter(Role.role_id == role_id).first() is None:
+            return None
+        updated = db.query(User).filter(User.user_id == user_id).update({User.role_id: role_id})
+        if not updated:
+            return None
+        db.commit()
+        return RoleService.get_user_role(db, user_id)
+
     @staticmethod
     def get_by_id(db: Session, role_id: int) -> Optional[RoleSchema]:
         """
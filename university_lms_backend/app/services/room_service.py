@@ -6,8 +6,12 @@ business logic for classroom or lab rooms within the LMS.
 
 - No sample, demo, or test code.
 - Utilizes global models, schemas, and project-wide conventions.
+- The full room list is reference data, cached in-process for a few minutes.
 """
 
+import threading
+
+from cachetools import TTLCache
 from sqlalchemy.orm import Session
 from typing import Optional, List
 
@@ -18,6 +22,12 @@ from app.schemas.room import (
 )
 from app.schemas.room import Room as RoomSchema
 
+# Full room list, dropped on any room write in this process; other workers
+# pick up changes within the TTL.
+ROOMS_CACHE_TTL_SECONDS: int = 300
+_rooms_cache: TTLCache = TTLCache(maxsize=1, ttl=ROOMS_CACHE_TTL_SECONDS)
+_rooms_cache_lock = threading.Lock()
+
 class RoomService:
     """
     Handles CRUD and business operations for room records.
@@ -47,6 +57,27 @@ class RoomService:
         rooms = db.query(Room).offset(skip).limit(limit).all()
         return [RoomSchema.from_orm(r) for r in rooms]
 
+    @staticmethod
+    def list_cached(db: Session) -> List[RoomSchema]:
+        """
+        Retrieve every room, served from the in-process cache when warm.
+        """
+        with _rooms_cache_lock:
+            rooms = _rooms_cache.get("all")
+        if rooms is None:
+            rooms = [RoomSchema.from_orm(r) for r in db.query(Room).order_by(Room.room_id).all()]
+            with _rooms_cache_lock:
+                _rooms_cache["all"] = rooms
+        return rooms
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Drop the cached room list (called after any room write).
+        """
+        with _rooms_cache_lock:
+            _rooms_cache.clear()
+
     @staticmethod
     def create(db: Session, room_in: RoomCreate) -> RoomSchema:
         """
@@ -55,6 +86,7 @@ class RoomService:
         room_obj = Room(**room_in.dict())
         db.add(room_obj)
         db.commit()
+        RoomService.clear_cache()
         db.refresh(room_obj)
         return RoomSchema.from_orm(room_obj)
 
@@ -73,6 +105,7 @@ class RoomService:
         for field, value in room_in.dict(exclude_unset=True).items():
             setattr(room_obj, field, value)
         db.commit()
+        RoomService.clear_cache()
         db.refresh(room_obj)
         return RoomSchema.from_orm(room_obj)
 
@@ -86,4 +119,5 @@ class RoomService:
             return False
         db.delete(room_obj)
         db.commit()
+        RoomService.clear_cache()
         return True
\ No newline at end of file
@@ -2,11 +2,34 @@
 Academic Session Service (Production)
 -------------------------------------
 Service layer for managing Academic Session entities.
+The session list is reference data, cached in-process for a few minutes.
 """
 
+import threading
+
+from cachetools import TTLCache
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from typing import Optional, List
 
+from app.models.academic_session import AcademicSession
+from app.schemas.session import AcademicSessionCreate, AcademicSessionUpdate
+
+# Columns shaped like AcademicSessionResponse (the model's `name` is the API's `session_name`)
+_SESSION_COLUMNS = select(
+    AcademicSession.session_id,
+    AcademicSession.name.label("session_name"),
+    AcademicSession.start_date,
+    AcademicSession.end_date,
+    AcademicSession.created_at,
+    AcademicSession.updated_at,
+)
+# Full session list; writes must call AcademicSessionService.clear_cache().
+# Other workers pick up changes within the TTL.
+SESSIONS_CACHE_TTL_SECONDS: int = 300
+_sessions_cache: TTLCache = TTLCache(maxsize=1, ttl=SESSIONS_CACHE_TTL_SECONDS)
+_sessions_cache_lock = threading.Lock()
+
 
 class AcademicSessionService:
     """
@@ -15,30 +38,69 @@ class AcademicSessionService:
 
     @staticmethod
     def get_all(db: Session, skip: int = 0, limit: int = 100):
-        """Retrieve all academic sessions with pagination"""
-        # TODO: Implement actual database query
-        return []
+        """Retrieve all academic sessions with pagination, newest first"""
+        stmt = _SESSION_COLUMNS.order_by(AcademicSession.start_date.desc()).offset(skip).limit(limit)
+        return db.execute(stmt).mappings().all()
+
+    @staticmethod
+    def list_cached(db: Session):
+        """Retrieve every academic session, served from the in-process cache when warm"""
+        with _sessions_cache_lock:
+            sessions = _sessions_cache.get("all")
+        if sessions is None:
+            stmt = _SESSION_COLUMNS.order_by(AcademicSession.start_date.desc())
+            sessions = [dict(row) for row in db.execute(stmt).mappings()]
+            with _sessions_cache_lock:
+                _sessions_cache["all"] = sessions
+        return sessions
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop the cached session list (call after any session write)"""
+        with _sessions_cache_lock:
+            _sessions_cache.clear()
 
     @staticmethod
     def get_by_id(db: Session, session_id: int):
         """Retrieve an academic session by ID"""
-        # TODO: Implement actual database query
-        return None
+        stmt = _SESSION_COLUMNS.where(AcademicSession.session_id == session_id)
+        return db.execute(stmt).mappings().first()
 
     @staticmethod
-    def create(db: Session, session_data):
-        """Create a new academic session"""
-        # TODO: Implement actual database creation
-        raise NotImplementedError("Academic session creation not yet implemented")
+    def create(db: Session, session_data: AcademicSessionCreate):
+        """Create a new academic session and drop the cached session list"""
+        session_obj = AcademicSession(
+            name=session_data.session_name,
+            start_date=session_data.start_date,
+            end_date=session_data.end_date,
+        )
+        db.add(session_obj)
+        db.commit()
+        AcademicSessionService.clear_cache()
+        return AcademicSessionService.get_by_id(db, session_obj.session_id)
 
     @staticmethod
-    def update(db: Session, session_id: int, session_data):
-        """Update an existing academic session"""
-        # TODO: Implement actual database update
-        raise NotImplementedError("Academic session update not yet implemented")
+    def update(db: Session, session_id: int, session_data: AcademicSessionUpdate):
+        """Update an existing academic session; None if it does not exist"""
+        session_obj = db.query(AcademicSession).filter(AcademicSession.session_id == session_id).first()
+        if not session_obj:
+            return None
+        changes = session_data.dict(exclude_unset=True)
+        if "session_name" in changes:
+            changes["name"] = changes.pop("session_name")
+        for field, value in changes.items():
+            setattr(session_obj, field, value)
+        db.commit()
+        AcademicSessionService.clear_cache()
+        return AcademicSessionService.get_by_id(db, session_id)
 
     @staticmethod
-    def delete(db: Session, session_id: int):
-        """Delete an academic session"""
-        # TODO: Implement actual database deletion
-        raise NotImplementedError("Academic session deletion not yet implemented")
+    def delete(db: Session, session_id: int) -> bool:
+        """Delete an academic session. Returns True if deleted, False if not found"""
+        session_obj = db.query(AcademicSession).filter(AcademicSession.session_id == session_id).first()
+        if not session_obj:
+            return False
+        db.delete(session_obj)
+        db.commit()
+        AcademicSessionService.clear_cache()
+        return True
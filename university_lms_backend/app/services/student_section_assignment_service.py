@@ -8,9 +8,12 @@ and business logic for student-to-section group assignments in the LMS.
 - Utilizes global models, schemas, and unified conventions.
 """
 
+from sqlalchemy import Boolean, bindparam, or_, select, tuple_
 from sqlalchemy.orm import Session
 from typing import Optional, List
 
+from app.core.permissions import is_offering_staff
+from app.core.responses import DEFAULT_PAGE_SIZE
 from app.models.student_section_assignment import StudentSectionAssignment
 from app.schemas.student_section_assignment import (
     StudentSectionAssignmentCreate,
@@ -18,6 +21,47 @@ from app.schemas.student_section_assignment import (
 )
 from app.schemas.student_section_assignment import StudentSectionAssignment as StudentSectionAssignmentSchema
 
+_ASSIGNMENT_COLUMNS = select(
+    StudentSectionAssignment.assignment_id,
+    StudentSectionAssignment.student_id,
+    StudentSectionAssignment.section_group_id,
+    StudentSectionAssignment.created_at,
+    StudentSectionAssignment.updated_at,
+)
+
+# Visible to admins, the student, and staff of the offering
+_ASSIGNMENTS_FOR_STUDENT = (
+    _ASSIGNMENT_COLUMNS
+    .where(
+        StudentSectionAssignment.student_id == bindparam("student_id"),
+        StudentSectionAssignment.assignment_id > bindparam("after"),
+        or_(
+            bindparam("viewer_is_admin", type_=Boolean),
+            StudentSectionAssignment.student_id == bindparam("viewer_id"),
+            is_offering_staff(StudentSectionAssignment.course_offering_id, bindparam("viewer_id")),
+        ),
+    )
+    .order_by(StudentSectionAssignment.assignment_id)
+    .limit(bindparam("limit"))
+)
+
+# Visible to admins and staff of the offering
+_ASSIGNMENTS_FOR_SECTION_GROUP = (
+    _ASSIGNMENT_COLUMNS
+    .where(
+        StudentSectionAssignment.section_group_id == bindparam("section_group_id"),
+        # Composite keyset: a student can hold several assignments in one group
+        tuple_(StudentSectionAssignment.student_id, StudentSectionAssignment.assignment_id)
+        > tuple_(bindparam("after_student_id"), bindparam("after_assignment_id")),
+        or_(
+            bindparam("viewer_is_admin", type_=Boolean),
+            is_offering_staff(StudentSectionAssignment.course_offering_id, bindparam("viewer_id")),
+        ),
+    )
+    .order_by(StudentSectionAssignment.student_id, StudentSectionAssignment.assignment_id)
+    .limit(bindparam("limit"))
+)
+
 class StudentSectionAssignmentService:
     """
     Handles CRUD and business operations for student section assignments.
@@ -33,6 +77,49 @@ class StudentSectionAssignmentService:
         ).first()
         return StudentSectionAssignmentSchema.from_orm(assign_obj) if assign_obj else None
 
+    @staticmethod
+    def get_visible_for_student(db: Session, student_id: int, viewer, after: int = 0, limit: int = DEFAULT_PAGE_SIZE) -> list:
+        """
+        One page of a student's section assignments that `viewer` may see, as row mappings,
+        ordered by assignment_id and starting after the `after` cursor.
+        """
+        return db.execute(
+            _ASSIGNMENTS_FOR_STUDENT,
+            {
+                "student_id": student_id,
+                "viewer_id": viewer.user_id,
+                "viewer_is_admin": bool(viewer.is_admin),
+                "after": after,
+                "limit": limit,
+            },
+        ).mappings().all()
+
+    @staticmethod
+    def get_visible_for_section_group(
+        db: Session,
+        section_group_id: int,
+        viewer,
+        after: tuple[int, int] = (0, 0),
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> list:
+        """
+        One page of a section group's student assignments that `viewer` may see, as row
+        mappings, ordered by (student_id, assignment_id) (served by the section group index)
+        and starting after the `after` (student_id, assignment_id) cursor.
+        """
+        after_student_id, after_assignment_id = after
+        return db.execute(
+            _ASSIGNMENTS_FOR_SECTION_GROUP,
+            {
+                "section_group_id": section_group_id,
+                "viewer_id": viewer.user_id,
+                "viewer_is_admin": bool(viewer.is_admin),
+                "after_student_id": after_student_id,
+                "after_assignment_id": after_assignment_id,
+                "limit": limit,
+            },
+        ).mappings().all()
+
     @staticmethod
     def get_by_section_group_id(db: Session, section_group_id: int) -> List[StudentSectionAssignmentSchema]:
         """
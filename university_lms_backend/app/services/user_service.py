@@ -8,7 +8,8 @@ for users within the LMS.
 - Utilizes global models, schemas, and unified conventions.
 """
 
-from sqlalchemy.orm import Session
+from sqlalchemy import or_
+from sqlalchemy.orm import Session, selectinload
 from typing import Optional, List
 
 from app.models.user import User
@@ -17,6 +18,7 @@ from app.schemas.user import (
     UserUpdate,
 )
 from app.schemas.user import User as UserSchema
+from app.core.responses import DEFAULT_PAGE_SIZE
 from app.core.security import get_password_hash
 
 class UserService:
@@ -72,6 +74,43 @@ class UserService:
         users = db.query(User).offset(skip).limit(limit).all()
         return [UserSchema.from_orm(u) for u in users]
 
+    @staticmethod
+    def list_users(
+        db: Session,
+        search: Optional[str] = None,
+        after: int = 0,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> List[User]:
+        """
+        Retrieve a page of users after the `after` user_id cursor, optionally matching
+        `search` against username, email, or name. Roles are loaded in one extra query
+        for the whole page. Returns ORM rows; the router validates and serializes them
+        in a single pass.
+        """
+        query = db.query(User).options(selectinload(User.role)).filter(User.user_id > after)
+        if search:
+            pattern = f"%{search}%"
+            query = query.filter(or_(
+                User.username.ilike(pattern),
+                User.email.ilike(pattern),
+                User.first_name.ilike(pattern),
+                User.last_name.ilike(pattern),
+            ))
+        return query.order_by(User.user_id).limit(limit).all()
+
+    @staticmethod
+    def set_status(db: Session, user_id: int, is_active: bool) -> Optional[UserSchema]:
+        """
+        Activate or deactivate a user account.
+        """
+        user_obj = db.query(User).filter(User.user_id == user_id).first()
+        if not user_obj:
+            return None
+        user_obj.is_active = is_active
+        db.commit()
+        db.refresh(user_obj)
+        return UserSchema.from_orm(user_obj)
+
     @staticmethod
     def create(db: Session, user_in: UserCreate) -> UserSchema:
         """
@@ -13,6 +13,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.models.base import Base
+from app.core.auth import clear_token_cache
 from app.core.database import get_db
 from app.main import create_app
 
@@ -37,6 +38,15 @@ def setup_database():
     # Drop tables after tests if needed
     Base.metadata.drop_all(bind=engine)
 
+@pytest.fixture(autouse=True)
+def reset_token_cache():
+    """
+    Ensures cached token resolutions never leak between tests.
+    """
+    clear_token_cache()
+    yield
+    clear_token_cache()
+
 @pytest.fixture(scope="function")
 def db_session():
     """
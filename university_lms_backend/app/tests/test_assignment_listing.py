@@ -0,0 +1,51 @@
+"""
+Test Assignment Listing - assignments with the student's own submission
+-----------------------------------------------------------------------
+Tests to verify the combined listing serializes through its response model,
+both with and without an existing submission.
+"""
+
+from datetime import date
+from types import SimpleNamespace
+from typing import List
+
+from pydantic import TypeAdapter
+
+from app.api.v1.assignments import list_assignments_with_my_submission
+from app.models.assignment import Assignment
+from app.models.assignment_submission import AssignmentSubmission
+from app.models.section_group import SectionGroup
+from app.schemas.assignment import AssignmentWithMySubmissionResponse
+
+STUDENT_ID = 7
+_RESPONSE = TypeAdapter(List[AssignmentWithMySubmissionResponse])
+
+
+class TestListAssignmentsWithMySubmission:
+    """Test the /section-group/{id}/with-my-submission listing"""
+
+    def test_serializes_existing_and_missing_submissions(self, db_session):
+        """A submitted assignment carries the submission; an open one carries null"""
+        group = SectionGroup(course_offering_id=1, name="Lab A")
+        submitted = Assignment(course_offering_id=1, title="Essay", due_date=date(2030, 1, 1))
+        pending = Assignment(course_offering_id=1, title="Report", due_date=date(2030, 2, 1))
+        db_session.add_all([group, submitted, pending])
+        db_session.flush()
+        db_session.add(AssignmentSubmission(
+            assignment_id=submitted.assignment_id, student_id=STUDENT_ID,
+            file_name="essay.pdf", grade="A",
+        ))
+        db_session.commit()
+
+        rows = list_assignments_with_my_submission(
+            section_group_id=group.section_group_id,
+            db=db_session,
+            current_user=SimpleNamespace(user_id=STUDENT_ID),
+        )
+        listing = _RESPONSE.validate_python(rows)
+
+        assert [item.assignment.title for item in listing] == ["Essay", "Report"]
+        assert listing[0].my_submission.file_name == "essay.pdf"
+        assert listing[0].my_submission.file_path is None
+        assert listing[0].my_submission.grade == "A"
+        assert listing[1].my_submission is None
@@ -2,22 +2,33 @@
 Test Auth Module - get_current_user function
 ---------------------------------------------
 Tests to verify the fix for the get_current_user function in auth.py.
-Ensures proper call to UserService.get_by_id with correct parameters.
+Ensures proper call to UserRepository.get_with_role with correct parameters.
 """
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from fastapi import HTTPException
+import orjson
 import pytest
 
-from app.core.auth import get_current_user
+from app.core.auth import get_current_user, resolve_token_user_id
+from app.core.auth_cache import get_cached_user
+from app.models.role import Role
+from app.models.user import User
 
 
 class TestGetCurrentUser:
     """Test the get_current_user function"""
 
+    @pytest.fixture(autouse=True)
+    def auth_cache(self):
+        """Bypass the Redis auth cache: every lookup misses and fills are recorded"""
+        with patch('app.core.auth.get_cached_user', AsyncMock(return_value=None)) as mock_get_cached_user, \
+                patch('app.core.auth.cache_user', AsyncMock()) as mock_cache_user:
+            yield mock_get_cached_user, mock_cache_user
+
     @pytest.mark.asyncio
     async def test_get_current_user_calls_correct_method(self, db_session):
-        """Test that get_current_user calls UserService.get_by_id with correct parameters"""
+        """Test that get_current_user calls UserRepository.get_with_role with correct parameters"""
         # Arrange
         mock_request = MagicMock()
         mock_request.headers.get.return_value = "Bearer valid_token"
@@ -26,21 +37,21 @@ class TestGetCurrentUser:
         with patch('app.core.auth.jwt.decode') as mock_jwt_decode:
             mock_jwt_decode.return_value = {"sub": "123"}
             
-            # Mock UserService.get_by_id to return a mock user
-            with patch('app.core.auth.UserService.get_by_id') as mock_get_by_id:
+            # Mock UserRepository.get_with_role to return a mock user
+            with patch('app.repositories.user_repo.UserRepository.get_with_role') as mock_get_with_role:
                 mock_user = MagicMock()
                 mock_user.is_active = True
-                mock_get_by_id.return_value = mock_user
+                mock_get_with_role.return_value = mock_user
                 
                 # Act
                 result = await get_current_user(request=mock_request, db=db_session)
                 
                 # Assert
-                # Verify that get_by_id was called (not get_user_by_id)
-                mock_get_by_id.assert_called_once()
+                # Verify that the user was loaded with its role
+                mock_get_with_role.assert_called_once()
                 
                 # Verify the correct parameters were passed
-                call_args = mock_get_by_id.call_args
+                call_args = mock_get_with_role.call_args
                 assert call_args[1]['db'] == db_session, "db parameter should be passed"
                 assert call_args[1]['user_id'] == 123, "user_id should be converted to int"
                 
@@ -48,7 +59,7 @@ class TestGetCurrentUser:
                 assert result == mock_user
 
     @pytest.mark.asyncio
-    async def test_get_current_user_raises_when_user_not_found(self, db_session):
+    async def test_get_current_user_raises_when_user_not_found(self, db_session, auth_cache):
         """Test that get_current_user raises 403 when user is not found"""
         # Arrange
         mock_request = MagicMock()
@@ -57,8 +68,8 @@ class TestGetCurrentUser:
         with patch('app.core.auth.jwt.decode') as mock_jwt_decode:
             mock_jwt_decode.return_value = {"sub": "999"}
             
-            with patch('app.core.auth.UserService.get_by_id') as mock_get_by_id:
-                mock_get_by_id.return_value = None
+            with patch('app.repositories.user_repo.UserRepository.get_with_role') as mock_get_with_role:
+                mock_get_with_role.return_value = None
                 
                 # Act & Assert
                 with pytest.raises(HTTPException) as exc_info:
@@ -66,9 +77,11 @@ class TestGetCurrentUser:
                 
                 assert exc_info.value.status_code == 403
                 assert "not active or does not exist" in exc_info.value.detail
+                # A rejected user is never written to the auth cache
+                auth_cache[1].assert_not_awaited()
 
     @pytest.mark.asyncio
-    async def test_get_current_user_raises_when_user_inactive(self, db_session):
+    async def test_get_current_user_raises_when_user_inactive(self, db_session, auth_cache):
         """Test that get_current_user raises 403 when user is inactive"""
         # Arrange
         mock_request = MagicMock()
@@ -77,10 +90,10 @@ class TestGetCurrentUser:
         with patch('app.core.auth.jwt.decode') as mock_jwt_decode:
             mock_jwt_decode.return_value = {"sub": "123"}
             
-            with patch('app.core.auth.UserService.get_by_id') as mock_get_by_id:
+            with patch('app.repositories.user_repo.UserRepository.get_with_role') as mock_get_with_role:
                 mock_user = MagicMock()
                 mock_user.is_active = False
-                mock_get_by_id.return_value = mock_user
+                mock_get_with_role.return_value = mock_user
                 
                 # Act & Assert
                 with pytest.raises(HTTPException) as exc_info:
@@ -88,6 +101,8 @@ class TestGetCurrentUser:
                 
                 assert exc_info.value.status_code == 403
                 assert "not active or does not exist" in exc_info.value.detail
+                # A rejected user is never written to the auth cache
+                auth_cache[1].assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_get_current_user_raises_when_user_id_not_numeric(self, db_session):
@@ -105,3 +120,63 @@ class TestGetCurrentUser:
             
             assert exc_info.value.status_code == 401
             assert "Token payload invalid" in exc_info.value.detail
+
+
+class TestResolveTokenUserId:
+    """Test the token -> user_id cache used by get_current_user"""
+
+    def test_decodes_each_token_once(self):
+        """Repeated resolutions of the same token reuse the cached claims"""
+        with patch('app.core.auth.jwt.decode') as mock_jwt_decode:
+            mock_jwt_decode.return_value = {"sub": "123"}
+
+            assert resolve_token_user_id("token_a") == 123
+            assert resolve_token_user_id("token_a") == 123
+
+            mock_jwt_decode.assert_called_once()
+
+    def test_expired_entry_is_decoded_again(self):
+        """A cached entry past the token's exp is not served"""
+        with patch('app.core.auth.jwt.decode') as mock_jwt_decode:
+            mock_jwt_decode.return_value = {"sub": "123", "exp": 1}
+
+            resolve_token_user_id("token_b")
+            resolve_token_user_id("token_b")
+
+            assert mock_jwt_decode.call_count == 2
+
+
+class TestGetCachedUser:
+    """Test the Redis auth cache hit path"""
+
+    @pytest.mark.asyncio
+    async def test_hit_is_attached_to_the_session(self, db_session):
+        """A cached user is a persistent row of the request's session, not a transient copy"""
+        role = Role(name="Administrator")
+        db_session.add(role)
+        db_session.flush()
+        user = User(
+            username="cached", email="cached@example.com", password_hash="hash",
+            first_name="Cached", last_name="User", role_id=role.role_id,
+        )
+        db_session.add(user)
+        db_session.commit()
+        user_id, role_id = user.user_id, role.role_id
+        db_session.expunge_all()
+
+        entry = {
+            "user_id": user_id, "username": "cached", "email": "cached@example.com",
+            "first_name": "Cached", "last_name": "User", "role_id": role_id, "is_active": True,
+            "role": {"role_id": role_id, "name": "Administrator"},
+        }
+        redis = MagicMock()
+        redis.get = AsyncMock(return_value=orjson.dumps(entry))
+        with patch('app.core.auth_cache.get_redis', return_value=redis):
+            result = await get_cached_user("cached_token", db_session)
+
+        assert result in db_session
+        assert result.is_admin
+        # Columns left out of the cache entry load from the database
+        assert result.password_hash == "hash"
+        # Nothing to flush: the cached user is not re-inserted
+        assert not db_session.new and not db_session.dirty
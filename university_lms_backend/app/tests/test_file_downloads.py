@@ -0,0 +1,30 @@
+"""
+Test File Downloads - Signed download URLs
+------------------------------------------
+Tests to verify download signatures are bound to a file and expire.
+"""
+
+import time
+
+from app.core.storage import sign_download, verify_download
+
+
+class TestSignedDownloads:
+    """Test sign_download / verify_download"""
+
+    def test_valid_signature_is_accepted(self):
+        """A freshly signed link verifies for the same file"""
+        expires, signature = sign_download(7)
+        assert verify_download(7, expires, signature)
+
+    def test_signature_is_bound_to_file_and_expiry(self):
+        """Reusing a signature for another file or a later expiry fails"""
+        expires, signature = sign_download(7)
+        assert not verify_download(8, expires, signature)
+        assert not verify_download(7, expires + 3600, signature)
+
+    def test_expired_signature_is_rejected(self):
+        """A link past its expiry no longer verifies"""
+        expires, signature = sign_download(7, ttl=-1)
+        assert expires < time.time()
+        assert not verify_download(7, expires, signature)
@@ -0,0 +1,87 @@
+"""
+Test Quiz Grading - set-based auto-grading on submit
+----------------------------------------------------
+Tests to verify a submitted attempt scores each question at most once,
+and only when exactly its correct options were selected.
+"""
+
+from app.models.question import Question
+from app.models.question_option import QuestionOption
+from app.models.quiz import Quiz
+from app.models.quiz_answer import QuizAnswer
+from app.models.quiz_attempt import QuizAttempt
+from app.services.quiz_attempt_service import QuizAttemptService
+
+STUDENT_ID = 1
+
+
+class TestSubmitGrading:
+    """Test QuizAttemptService.submit scoring"""
+
+    @staticmethod
+    def _question(db, quiz, points, correct, wrong):
+        """Adds a question with `correct` right and `wrong` wrong options; returns (question, rights, wrongs)"""
+        question = Question(quiz_id=quiz.quiz_id, text="Q", question_type="MCQ", points=points)
+        db.add(question)
+        db.flush()
+        rights = [QuestionOption(question_id=question.question_id, text="R", is_correct=True) for _ in range(correct)]
+        wrongs = [QuestionOption(question_id=question.question_id, text="W", is_correct=False) for _ in range(wrong)]
+        db.add_all(rights + wrongs)
+        db.flush()
+        return question, rights, wrongs
+
+    @staticmethod
+    def _answer(db, attempt, question, option):
+        db.add(QuizAnswer(
+            attempt_id=attempt.attempt_id, question_id=question.question_id,
+            student_id=STUDENT_ID, selected_option_id=option.option_id,
+        ))
+
+    def test_points_awarded_once_per_question(self, db_session):
+        """Multi-select and duplicate answer rows never score more than the quiz is worth"""
+        quiz = Quiz(course_offering_id=1, title="Quiz", total_points=6)
+        db_session.add(quiz)
+        db_session.flush()
+        single, single_rights, _ = self._question(db_session, quiz, 1, correct=1, wrong=1)
+        multi, multi_rights, _ = self._question(db_session, quiz, 2, correct=2, wrong=1)
+        partial, partial_rights, partial_wrongs = self._question(db_session, quiz, 3, correct=1, wrong=1)
+        attempt = QuizAttempt(quiz_id=quiz.quiz_id, student_id=STUDENT_ID)
+        db_session.add(attempt)
+        db_session.flush()
+
+        # The single-answer question is answered correctly, twice
+        self._answer(db_session, attempt, single, single_rights[0])
+        self._answer(db_session, attempt, single, single_rights[0])
+        # Both correct options of the multi-select question
+        for option in multi_rights:
+            self._answer(db_session, attempt, multi, option)
+        # The right option plus a wrong one earns nothing
+        self._answer(db_session, attempt, partial, partial_rights[0])
+        self._answer(db_session, attempt, partial, partial_wrongs[0])
+        db_session.commit()
+
+        result = QuizAttemptService.submit(db_session, attempt.attempt_id, STUDENT_ID)
+
+        assert result["score"] == 3
+        scores = dict(
+            db_session.query(QuizAnswer.question_id, QuizAnswer.score_awarded)
+            .filter(QuizAnswer.attempt_id == attempt.attempt_id, QuizAnswer.score_awarded > 0)
+            .all()
+        )
+        assert scores == {single.question_id: 1, multi.question_id: 2}
+
+    def test_missing_a_correct_option_earns_nothing(self, db_session):
+        """Selecting only some of a question's correct options scores zero"""
+        quiz = Quiz(course_offering_id=1, title="Quiz", total_points=2)
+        db_session.add(quiz)
+        db_session.flush()
+        multi, multi_rights, _ = self._question(db_session, quiz, 2, correct=2, wrong=0)
+        attempt = QuizAttempt(quiz_id=quiz.quiz_id, student_id=STUDENT_ID)
+        db_session.add(attempt)
+        db_session.flush()
+        self._answer(db_session, attempt, multi, multi_rights[0])
+        db_session.commit()
+
+        result = QuizAttemptService.submit(db_session, attempt.attempt_id, STUDENT_ID)
+
+        assert result["score"] == 0
@@ -0,0 +1,37 @@
+"""
+Test RBAC Cache - request-scoped permission decisions
+-----------------------------------------------------
+Tests to verify permission decisions are computed once per request and
+dropped again after a mutation invalidates them.
+"""
+
+from types import SimpleNamespace
+
+from app.core.permissions import RBACCache, cached_decision
+
+
+class TestRBACCache:
+    """Test RBACCache and cached_decision"""
+
+    def test_decision_is_computed_once(self):
+        """A repeated check for the same key reuses the first result"""
+        cache = RBACCache()
+        calls = []
+        check = lambda: calls.append(1) or True
+        assert cache.get_or_compute((1, "quiz:manage", 5), check)
+        assert cache.get_or_compute((1, "quiz:manage", 5), check)
+        assert len(calls) == 1
+
+    def test_invalidate_drops_only_matching_resource(self):
+        """Invalidation clears the given resource's decisions and keeps the rest"""
+        cache = RBACCache()
+        cache.get_or_compute((1, "quiz:manage", 5), lambda: True)
+        cache.get_or_compute((1, "quiz:manage", 6), lambda: True)
+        cache.invalidate("quiz:", 5)
+        assert cache.get_or_compute((1, "quiz:manage", 5), lambda: False) is False
+        assert cache.get_or_compute((1, "quiz:manage", 6), lambda: False) is True
+
+    def test_user_without_cache_computes_directly(self):
+        """cached_decision still works for users not resolved through get_current_user"""
+        user = SimpleNamespace(user_id=1)
+        assert cached_decision(user, "quiz:manage", 5, lambda: True) is True
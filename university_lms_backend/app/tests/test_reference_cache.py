@@ -0,0 +1,54 @@
+"""
+Test Reference Cache - in-process room and session lists
+--------------------------------------------------------
+Tests to verify writes through the services drop the cached lists,
+so the next read sees the change.
+"""
+
+from datetime import date
+
+from app.models.room import Room
+from app.schemas.room import RoomUpdate
+from app.schemas.session import AcademicSessionCreate, AcademicSessionUpdate
+from app.services.room_service import RoomService
+from app.services.session_service import AcademicSessionService
+
+
+class TestSessionListCache:
+    """Test AcademicSessionService writes against list_cached"""
+
+    def test_writes_refresh_the_list(self, db_session):
+        """Create, update and delete are each visible to the next cached read"""
+        AcademicSessionService.clear_cache()
+        assert AcademicSessionService.list_cached(db_session) == []
+
+        created = AcademicSessionService.create(db_session, AcademicSessionCreate(
+            session_name="Fall 2030", start_date=date(2030, 9, 1), end_date=date(2030, 12, 20),
+        ))
+        assert [s["session_name"] for s in AcademicSessionService.list_cached(db_session)] == ["Fall 2030"]
+
+        AcademicSessionService.update(
+            db_session, created["session_id"], AcademicSessionUpdate(session_name="Autumn 2030")
+        )
+        assert [s["session_name"] for s in AcademicSessionService.list_cached(db_session)] == ["Autumn 2030"]
+
+        assert AcademicSessionService.delete(db_session, created["session_id"])
+        assert AcademicSessionService.list_cached(db_session) == []
+
+
+class TestRoomListCache:
+    """Test RoomService writes against list_cached"""
+
+    def test_writes_refresh_the_list(self, db_session):
+        """Update and delete are each visible to the next cached read"""
+        room = Room(code="LAB5", name="Lab 5", capacity=30)
+        db_session.add(room)
+        db_session.commit()
+        RoomService.clear_cache()
+        assert [r.name for r in RoomService.list_cached(db_session)] == ["Lab 5"]
+
+        RoomService.update(db_session, room.room_id, RoomUpdate(name="Lab Five"))
+        assert [r.name for r in RoomService.list_cached(db_session)] == ["Lab Five"]
+
+        assert RoomService.delete(db_session, room.room_id)
+        assert RoomService.list_cached(db_session) == []
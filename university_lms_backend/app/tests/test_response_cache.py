@@ -0,0 +1,46 @@
+"""
+Test Response Cache - cached bodies and their ETags
+---------------------------------------------------
+Tests to verify a cached list is served with the ETag stored alongside its body,
+so conditional GETs match what the client holds without a database query.
+"""
+
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import orjson
+import pytest
+from redis.exceptions import RedisError
+
+from app.core.cache import cached_json_response
+from app.core.responses import body_etag
+
+
+class TestCachedJsonResponse:
+    """Test cached_json_response"""
+
+    @pytest.mark.asyncio
+    async def test_hit_serves_the_stored_etag(self):
+        """A cache hit returns the stored body and tag without calling the loader"""
+        body = orjson.dumps([{"code": "CS"}])
+        redis = MagicMock()
+        redis.hmget = AsyncMock(return_value=[body, body_etag(body).encode(), str(time.time() + 60).encode()])
+        loader = AsyncMock()
+        with patch('app.core.cache.get_redis', return_value=redis):
+            response = await cached_json_response("departments", "all:1", 60, 0, loader)
+
+        loader.assert_not_called()
+        assert response.body == body
+        assert response.headers["ETag"] == body_etag(body)
+
+    @pytest.mark.asyncio
+    async def test_miss_tags_the_loaded_body(self):
+        """Without a cache entry the loaded body is tagged from its own bytes"""
+        redis = MagicMock()
+        redis.hmget = AsyncMock(side_effect=RedisError("down"))
+        redis.pipeline = MagicMock(side_effect=RedisError("down"))
+        loader = AsyncMock(return_value=[{"code": "CS"}])
+        with patch('app.core.cache.get_redis', return_value=redis):
+            response = await cached_json_response("departments", "all:1", 60, 0, loader)
+
+        assert response.headers["ETag"] == body_etag(response.body)
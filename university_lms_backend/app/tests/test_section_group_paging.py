@@ -0,0 +1,45 @@
+"""
+Test Section Group Paging - keyset cursor over student assignments
+------------------------------------------------------------------
+Tests to verify paging a section group's students follows the composite
+(student_id, assignment_id) cursor, so a student with several rows in the
+group is never skipped at a page boundary.
+"""
+
+from types import SimpleNamespace
+
+import orjson
+
+from app.api.v1.student_section_assignments import list_students_for_section_group
+from app.core.responses import NEXT_CURSOR_HEADER
+from app.models.section_group import SectionGroup
+from app.models.student_section_assignment import StudentSectionAssignment
+
+ADMIN = SimpleNamespace(user_id=1, is_admin=True)
+
+
+class TestListStudentsForSectionGroup:
+    """Test the /section-group/{id} student listing"""
+
+    def test_pages_through_repeated_student(self, db_session):
+        """Every row is served once, even when a student's rows straddle a page"""
+        group = SectionGroup(course_offering_id=1, name="Lab B")
+        db_session.add(group)
+        db_session.flush()
+        assignments = [
+            StudentSectionAssignment(student_id=student_id, section_group_id=group.section_group_id, course_offering_id=1)
+            for student_id in (10, 20, 20, 30)
+        ]
+        db_session.add_all(assignments)
+        db_session.commit()
+
+        served, after = [], "0:0"
+        while after is not None:
+            response = list_students_for_section_group(
+                section_group_id=group.section_group_id, after=after, limit=2,
+                db=db_session, current_user=ADMIN,
+            )
+            served.extend(row["assignment_id"] for row in orjson.loads(response.body))
+            after = response.headers.get(NEXT_CURSOR_HEADER)
+
+        assert served == [assignment.assignment_id for assignment in assignments]
@@ -0,0 +1,36 @@
+"""
+Test Upload Limits - UploadSizeLimitMiddleware
+----------------------------------------------
+Tests to verify oversized multipart uploads are refused from their headers,
+before FastAPI reads the request body or runs any dependency.
+"""
+
+from fastapi.testclient import TestClient
+
+from app.core.security import MAX_UPLOAD_SIZE
+from app.main import create_app
+
+
+class TestUploadSizeLimitMiddleware:
+    """Test the UploadSizeLimitMiddleware registered by create_app"""
+
+    def setup_method(self):
+        self.client = TestClient(create_app())
+
+    def test_rejects_oversized_multipart_upload(self):
+        """A multipart body larger than the limit gets 413 before auth runs"""
+        payload = b"x" * (MAX_UPLOAD_SIZE + 1024 * 1024)
+        response = self.client.post(
+            "/api/v1/assignment-files/?assignment_id=1",
+            files={"file": ("big.pdf", payload)},
+        )
+        assert response.status_code == 413
+        assert response.json() == {"detail": "File is too large."}
+
+    def test_passes_small_multipart_upload_through(self):
+        """A small upload reaches the endpoint (and fails auth, not the size check)"""
+        response = self.client.post(
+            "/api/v1/assignment-files/?assignment_id=1",
+            files={"file": ("small.pdf", b"x" * 100)},
+        )
+        assert response.status_code == 401
@@ -6,6 +6,9 @@ and User model. Ensures proper mapping from status (string) to is_active (boolea
 """
 
 from unittest.mock import MagicMock, patch
+import orjson
+from sqlalchemy import event
+from sqlalchemy.orm import raiseload
 from app.services.user_service import UserService
 from app.schemas.user import UserCreate, UserUpdate
 
@@ -288,3 +291,46 @@ class TestUserSchemaRoleSerialization:
         
         # Assert
         assert user_schema_inactive.status == "inactive", f"Expected status='inactive', got status='{user_schema_inactive.status}'"
+
+
+class TestListUsersPaging:
+    """Test the keyset-paginated admin user list"""
+
+    @staticmethod
+    def _raise_on_lazy_load(session):
+        """Makes any relationship not eagerly loaded by the query raise on access"""
+        @event.listens_for(session, "do_orm_execute")
+        def add_raiseload(state):
+            if state.is_select:
+                state.statement = state.statement.options(raiseload("*"))
+
+    def test_pages_follow_the_cursor(self, db_session):
+        """Full pages point at the next one; the short last page has no cursor"""
+        from app.api.v1.users import list_users
+        from app.core.responses import NEXT_CURSOR_HEADER
+        from app.models.role import Role
+        from app.models.user import User
+
+        role = Role(name="Student")
+        db_session.add(role)
+        db_session.flush()
+        for i in range(3):
+            db_session.add(User(
+                username=f"pager{i}", email=f"pager{i}@example.com", password_hash="hash",
+                first_name="Page", last_name=str(i), role_id=role.role_id,
+            ))
+        db_session.commit()
+        db_session.expunge_all()
+        self._raise_on_lazy_load(db_session)
+
+        first = list_users(search="pager", after=0, limit=2, db=db_session)
+        first_page = orjson.loads(first.body)
+        assert [u["username"] for u in first_page] == ["pager0", "pager1"]
+        assert {u["role"] for u in first_page} == {"Student"}
+        assert first.headers[NEXT_CURSOR_HEADER] == str(first_page[-1]["user_id"])
+
+        last = list_users(search="pager", after=int(first.headers[NEXT_CURSOR_HEADER]), limit=2, db=db_session)
+        last_page = orjson.loads(last.body)
+        assert [u["username"] for u in last_page] == ["pager2"]
+        assert last_page[0]["role"] == "Student"
+        assert NEXT_CURSOR_HEADER not in last.headers
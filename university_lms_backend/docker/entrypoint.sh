@@ -35,4 +35,4 @@ alembic upgrade head
 
 # Start the backend server (Uvicorn)
 echo "Starting FastAPI backend with Uvicorn..."
-exec uvicorn app.main:app --host 0.0.0.0 --port 8000
\ No newline at end of file
+exec uvicorn app.main:app --host 0.0.0.0 --port 8000 --http httptools --loop uvloop
\ No newline at end of file